@@ -1,13 +1,20 @@
 """FastAPI application for managing and monitoring the hospitality agent."""
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import JSONResponse
-from fastapi.middleware.cors import CORSMiddleware
+from fastapi import Depends, FastAPI, HTTPException, Response
+from fastapi.responses import ORJSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
 from contextlib import asynccontextmanager
+import asyncio
 import os
+import signal
+import sys
 from typing import Dict, Any, Optional
 
-from config import ApplicationSettings
+import orjson
+from livekit import api as livekit_api
+
+from config import ApplicationSettings, LiveKitSettings, get_settings, reload_env
 from utils.logger import LOGGER
+from api.middleware import CORSLite
 from api.models import (
     TokenRequest,
     TokenResponse,
@@ -26,15 +33,97 @@ agent_status: Dict[str, Any] = {
 }
 
 
+# Static payloads serialized once at import time
+_ROOT_BYTES = orjson.dumps({
+    "service": "Hospitality Agent API",
+    "version": "1.0.0",
+    "endpoints": {
+        "health": "/health",
+        "health_deep": "/health/deep",
+        "status": "/status",
+        "config": "/config",
+        "token": "/api/token (POST)",
+        "room_create": "/api/room/create (POST)",
+        "room_list": "/api/room/list (GET)",
+        "docs": "/docs",
+        "openapi": "/openapi.json"
+    }
+})
+
+_HEALTH_BYTES = {
+    status: orjson.dumps({
+        "status": "healthy",
+        "agent_status": status,
+        "service": "hospitality-agent-api"
+    })
+    for status in ("ready", "running", "stopped")
+}
+
+
+# Seconds a replaced LiveKit client stays open for requests still using it
+_CLIENT_CLOSE_DELAY = 30.0
+
+# Background tasks, referenced until done so they aren't garbage-collected
+_background_tasks: set = set()
+
+
+def _create_livekit_api() -> Optional[livekit_api.LiveKitAPI]:
+    """Build a LiveKit API client from the current settings, if configured."""
+    try:
+        settings = get_settings()
+        if settings.livekit:
+            return livekit_api.LiveKitAPI(
+                settings.livekit.LIVEKIT_URL,
+                settings.livekit.LIVEKIT_API_KEY,
+                settings.livekit.LIVEKIT_API_SECRET
+            )
+    except Exception as e:
+        LOGGER.warning("LiveKit API client not initialized: %s", e)
+    return None
+
+
+async def _close_later(client: livekit_api.LiveKitAPI) -> None:
+    await asyncio.sleep(_CLIENT_CLOSE_DELAY)
+    await client.aclose()
+
+
+def _reload_settings(app: FastAPI) -> None:
+    """
+    Reload config.yml and the dotenv files, and rebuild the LiveKit client.
+
+    Variables set in the process environment itself cannot change and still
+    take precedence over the dotenv files.
+    """
+    reload_env()
+    get_settings.cache_clear()
+    old_client, app.state.lk_api = app.state.lk_api, _create_livekit_api()
+    LOGGER.info("Settings reloaded")
+    if old_client is not None:
+        task = asyncio.create_task(_close_later(old_client))
+        _background_tasks.add(task)
+        task.add_done_callback(_background_tasks.discard)
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Manage application lifespan events."""
     # Startup
     LOGGER.info("FastAPI application starting up")
+    # Share one LiveKit API client (and its HTTP connection pool) across requests
+    app.state.lk_api = _create_livekit_api()
+
+    # Settings and secrets are cached for the process lifetime; SIGHUP forces a reload
+    try:
+        asyncio.get_running_loop().add_signal_handler(signal.SIGHUP, _reload_settings, app)
+    except (AttributeError, NotImplementedError, RuntimeError):
+        LOGGER.warning("SIGHUP settings reload is not supported on this platform")
+
     agent_status["status"] = "running"
     yield
     # Shutdown
     LOGGER.info("FastAPI application shutting down")
+    if app.state.lk_api is not None:
+        await app.state.lk_api.aclose()
     agent_status["status"] = "stopped"
 
 
@@ -43,37 +132,79 @@ app = FastAPI(
     title="Hospitality Agent API",
     description="API for managing and monitoring the LiveKit hospitality agent",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan
 )
 
-# Add CORS middleware for React Native
+# Compress larger JSON payloads (room list, status, config) for mobile clients
+app.add_middleware(GZipMiddleware, minimum_size=1000, compresslevel=5)
+
+# Add CORS middleware for React Native. Added last so it is the outermost
+# middleware: preflight OPTIONS requests are answered before routing.
 app.add_middleware(
-    CORSMiddleware,
-    allow_origins=["*"],  # In production, specify your React Native app origins
+    CORSLite,
+    allow_origins=("*",),  # In production, specify your React Native app origins
     allow_credentials=True,
-    allow_methods=["*"],
-    allow_headers=["*"],
+    allow_methods=("*",),
+    allow_headers=("*",),
 )
 
 
-@app.get("/health")
+def _get_livekit_api():
+    """Return the shared LiveKit API client created during startup."""
+    lk_api = getattr(app.state, "lk_api", None)
+    if lk_api is None:
+        raise HTTPException(
+            status_code=500,
+            detail="LiveKit API client is not initialized"
+        )
+    return lk_api
+
+
+def _build_token(livekit: LiveKitSettings, request: TokenRequest) -> str:
+    """Build and sign a LiveKit access token (CPU-bound)."""
+    return livekit_api.AccessToken(
+        livekit.LIVEKIT_API_KEY,
+        livekit.LIVEKIT_API_SECRET
+    ) \
+        .with_identity(request.participant_identity or request.participant_name) \
+        .with_name(request.participant_name) \
+        .with_grants(livekit_api.VideoGrants(
+            room_join=True,
+            room=request.room_name,
+            can_publish=True,
+            can_subscribe=True,
+        )) \
+        .to_jwt()
+
+
+@app.api_route("/health", methods=["GET", "HEAD"])
 async def health_check():
     """
     Health check endpoint.
-    Returns the health status of the API and agent.
+    Returns the liveness status of the API and agent from a pre-serialized payload.
+    """
+    return Response(content=_HEALTH_BYTES[agent_status["status"]], media_type="application/json")
+
+
+@app.get("/health/deep")
+async def deep_health_check():
+    """
+    Readiness check endpoint.
+    Verifies the configuration can be loaded before reporting healthy.
     """
     try:
         # Try to load configuration to verify it's accessible
-        settings = ApplicationSettings.from_cfg('config/config.yml')
+        get_settings()
         
-        return JSONResponse({
+        return {
             "status": "healthy",
             "agent_status": agent_status["status"],
             "config_loaded": True,
             "service": "hospitality-agent-api"
-        })
+        }
     except Exception as e:
-        LOGGER.error(f"Health check failed: {e}")
+        LOGGER.error("Health check failed: %s", e)
         raise HTTPException(
             status_code=503,
             detail=f"Service unhealthy: {str(e)}"
@@ -81,15 +212,13 @@ async def health_check():
 
 
 @app.get("/status")
-async def get_status():
+async def get_status(settings: ApplicationSettings = Depends(get_settings)):
     """
     Get current agent status.
     Returns detailed status information about the agent.
     """
     try:
-        settings = ApplicationSettings.from_cfg('config/config.yml')
-        
-        return JSONResponse({
+        return {
             "status": agent_status["status"],
             "active_rooms": agent_status["active_rooms"],
             "uptime": agent_status["uptime"],
@@ -111,9 +240,9 @@ async def get_status():
                     "voice": settings.tts.voice,
                 }
             }
-        })
+        }
     except Exception as e:
-        LOGGER.error(f"Failed to get status: {e}")
+        LOGGER.error("Failed to get status: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve status: {str(e)}"
@@ -121,15 +250,13 @@ async def get_status():
 
 
 @app.get("/config")
-async def get_config():
+async def get_config(settings: ApplicationSettings = Depends(get_settings)):
     """
     Get current agent configuration.
     Returns the current configuration settings (without sensitive data).
     """
     try:
-        settings = ApplicationSettings.from_cfg('config/config.yml')
-        
-        return JSONResponse({
+        return {
             "llm": {
                 "type": settings.llm.type,
                 "model": settings.llm.model,
@@ -149,49 +276,34 @@ async def get_config():
                 "voice": settings.tts.voice,
                 "base_url": settings.tts.base_url,
             }
-        })
+        }
     except Exception as e:
-        LOGGER.error(f"Failed to get configuration: {e}")
+        LOGGER.error("Failed to get configuration: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to retrieve configuration: {str(e)}"
         )
 
 
-@app.post("/api/token", response_model=TokenResponse)
-async def generate_token(request: TokenRequest):
+# Schema is documented via `responses`; the trusted payload is not re-validated
+@app.post("/api/token", responses={200: {"model": TokenResponse}})
+async def generate_token(request: TokenRequest, settings: ApplicationSettings = Depends(get_settings)):
     """
     Generate LiveKit access token for React Native client.
     This is the critical endpoint for frontend integration.
     """
     try:
-        settings = ApplicationSettings.from_cfg('config/config.yml')
-        
         if not settings.livekit:
             raise HTTPException(
                 status_code=500,
                 detail="LiveKit configuration not found. Please set LIVEKIT_URL, LIVEKIT_API_KEY, and LIVEKIT_API_SECRET environment variables."
             )
         
-        # Import LiveKit API for token generation
-        from livekit import api
+        # Sign the JWT off the event loop
+        token = await asyncio.to_thread(_build_token, settings.livekit, request)
         
-        # Create access token
-        token = api.AccessToken(
-            settings.livekit.LIVEKIT_API_KEY,
-            settings.livekit.LIVEKIT_API_SECRET
-        ) \
-            .with_identity(request.participant_identity or request.participant_name) \
-            .with_name(request.participant_name) \
-            .with_grants(api.VideoGrants(
-                room_join=True,
-                room=request.room_name,
-                can_publish=True,
-                can_subscribe=True,
-            )) \
-            .to_jwt()
-        
-        return TokenResponse(
+        # Fields are produced here, so skip re-validating them
+        return TokenResponse.model_construct(
             token=token,
             url=settings.livekit.LIVEKIT_URL,
             room_name=request.room_name,
@@ -201,7 +313,7 @@ async def generate_token(request: TokenRequest):
     except HTTPException:
         raise
     except Exception as e:
-        LOGGER.error(f"Failed to generate token: {e}")
+        LOGGER.error("Failed to generate token: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to generate token: {str(e)}"
@@ -209,27 +321,19 @@ async def generate_token(request: TokenRequest):
 
 
 @app.post("/api/room/create")
-async def create_room(request: CreateRoomRequest):
+async def create_room(request: CreateRoomRequest, settings: ApplicationSettings = Depends(get_settings)):
     """Create a new LiveKit room."""
     try:
-        settings = ApplicationSettings.from_cfg('config/config.yml')
-        
         if not settings.livekit:
             raise HTTPException(
                 status_code=500,
                 detail="LiveKit configuration not found"
             )
         
-        from livekit import api
-        
-        lk_api = api.LiveKitAPI(
-            settings.livekit.LIVEKIT_URL,
-            settings.livekit.LIVEKIT_API_KEY,
-            settings.livekit.LIVEKIT_API_SECRET
-        )
+        lk_api = _get_livekit_api()
         
         # Create room request
-        create_request = api.CreateRoomRequest(name=request.room_name)
+        create_request = livekit_api.CreateRoomRequest(name=request.room_name)
         if request.empty_timeout:
             create_request.empty_timeout = request.empty_timeout
         if request.max_participants:
@@ -249,74 +353,54 @@ async def create_room(request: CreateRoomRequest):
     except HTTPException:
         raise
     except Exception as e:
-        LOGGER.error(f"Failed to create room: {e}")
+        LOGGER.error("Failed to create room: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to create room: {str(e)}"
         )
 
 
-@app.get("/api/room/list", response_model=RoomListResponse)
-async def list_rooms():
+@app.get("/api/room/list", responses={200: {"model": RoomListResponse}})
+async def list_rooms(settings: ApplicationSettings = Depends(get_settings)):
     """List all active LiveKit rooms."""
     try:
-        settings = ApplicationSettings.from_cfg('config/config.yml')
-        
         if not settings.livekit:
             raise HTTPException(
                 status_code=500,
                 detail="LiveKit configuration not found"
             )
         
-        from livekit import api
-        
-        lk_api = api.LiveKitAPI(
-            settings.livekit.LIVEKIT_URL,
-            settings.livekit.LIVEKIT_API_KEY,
-            settings.livekit.LIVEKIT_API_SECRET
-        )
+        lk_api = _get_livekit_api()
         
         rooms = await lk_api.room.list_rooms()
         
-        room_list = []
-        for room in rooms.rooms:
-            room_info = RoomInfo(
+        room_list = [
+            RoomInfo.model_construct(
                 name=room.name,
-                num_participants=len(room.participants) if hasattr(room, 'participants') else 0,
-                creation_time=str(room.creation_time) if hasattr(room, 'creation_time') else None,
-                empty_timeout=room.empty_timeout if hasattr(room, 'empty_timeout') else None,
-                max_participants=room.max_participants if hasattr(room, 'max_participants') else None,
+                num_participants=getattr(room, 'num_participants', 0),
+                creation_time=str(getattr(room, 'creation_time', '')) or None,
+                empty_timeout=getattr(room, 'empty_timeout', None),
+                max_participants=getattr(room, 'max_participants', None),
             )
-            room_list.append(room_info)
+            for room in rooms.rooms
+        ]
+        count = len(room_list)
         
-        return RoomListResponse(rooms=room_list, count=len(room_list))
+        return RoomListResponse.model_construct(rooms=room_list, count=count)
     except HTTPException:
         raise
     except Exception as e:
-        LOGGER.error(f"Failed to list rooms: {e}")
+        LOGGER.error("Failed to list rooms: %s", e)
         raise HTTPException(
             status_code=500,
             detail=f"Failed to list rooms: {str(e)}"
         )
 
 
-@app.get("/")
+@app.api_route("/", methods=["GET", "HEAD"])
 async def root():
     """Root endpoint with API information."""
-    return JSONResponse({
-        "service": "Hospitality Agent API",
-        "version": "1.0.0",
-        "endpoints": {
-            "health": "/health",
-            "status": "/status",
-            "config": "/config",
-            "token": "/api/token (POST)",
-            "room_create": "/api/room/create (POST)",
-            "room_list": "/api/room/list (GET)",
-            "docs": "/docs",
-            "openapi": "/openapi.json"
-        }
-    })
+    return Response(content=_ROOT_BYTES, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -325,12 +409,16 @@ if __name__ == "__main__":
     port = int(os.getenv("API_PORT", "8000"))
     host = os.getenv("API_HOST", "0.0.0.0")
     
-    LOGGER.info(f"Starting FastAPI server on {host}:{port}")
+    LOGGER.info("Starting FastAPI server on %s:%s", host, port)
     uvicorn.run(
         "api.app:app",
         host=host,
         port=port,
+        # uvloop is not available on Windows; uvicorn falls back to asyncio there
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools",
         log_level="info",
-        reload=False
+        reload=False,
+        workers=int(os.getenv("API_WORKERS", "1"))
     )
 
@@ -0,0 +1,90 @@
+"""Lightweight ASGI middleware for the agent management API."""
+from typing import Iterable, List, Tuple
+
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+
+ALL_METHODS = ("DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT")
+
+
+class CORSLite:
+    """
+    Pure ASGI CORS middleware.
+
+    Injects the ``access-control-*`` headers straight into the
+    ``http.response.start`` message and answers preflight requests without
+    touching the router, so no Request/Response objects are built per call.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        allow_origins: Iterable[str] = ("*",),
+        allow_credentials: bool = False,
+        allow_methods: Iterable[str] = ("*",),
+        allow_headers: Iterable[str] = ("*",),
+        max_age: int = 600,
+    ) -> None:
+        self.app = app
+        self.allow_origins = frozenset(allow_origins)
+        self.allow_all_origins = "*" in self.allow_origins
+        self.allow_all_headers = "*" in allow_headers
+        self.allow_credentials = allow_credentials
+
+        methods = ALL_METHODS if "*" in allow_methods else tuple(allow_methods)
+        self.simple_headers: List[Tuple[bytes, bytes]] = []
+        if allow_credentials:
+            self.simple_headers.append((b"access-control-allow-credentials", b"true"))
+        self.preflight_headers: List[Tuple[bytes, bytes]] = self.simple_headers + [
+            (b"access-control-allow-methods", ", ".join(methods).encode("latin-1")),
+            (b"access-control-max-age", str(max_age).encode("latin-1")),
+        ]
+        if not self.allow_all_headers:
+            self.preflight_headers.append(
+                (b"access-control-allow-headers", ", ".join(allow_headers).encode("latin-1"))
+            )
+
+    def _origin_headers(self, origin: bytes) -> List[Tuple[bytes, bytes]]:
+        # A wildcard cannot be combined with credentials, so echo the origin instead
+        if self.allow_all_origins and not self.allow_credentials:
+            return [(b"access-control-allow-origin", b"*")]
+        return [(b"access-control-allow-origin", origin), (b"vary", b"Origin")]
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        origin = request_method = request_headers = None
+        for key, value in scope["headers"]:
+            if key == b"origin":
+                origin = value
+            elif key == b"access-control-request-method":
+                request_method = value
+            elif key == b"access-control-request-headers":
+                request_headers = value
+
+        if origin is None or not (
+            self.allow_all_origins or origin.decode("latin-1") in self.allow_origins
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        cors_headers = self._origin_headers(origin)
+
+        if scope["method"] == "OPTIONS" and request_method is not None:
+            headers = cors_headers + self.preflight_headers
+            if self.allow_all_headers and request_headers:
+                headers.append((b"access-control-allow-headers", request_headers))
+            await send({"type": "http.response.start", "status": 204, "headers": headers})
+            await send({"type": "http.response.body", "body": b""})
+            return
+
+        cors_headers += self.simple_headers
+
+        async def send_with_cors(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", ())) + cors_headers
+            await send(message)
+
+        await self.app(scope, receive, send_with_cors)
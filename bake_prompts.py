@@ -0,0 +1,41 @@
+#!/usr/bin/env python3
+"""Bake the use case prompt files into a Python module at deploy time.
+
+Writes modules/_baked_prompts.py, which PromptLoader checks before reading
+prompt files from disk. Run it again after editing any file in
+config/prompts/, or delete the generated module to go back to reading the
+YAML files.
+"""
+from pathlib import Path
+
+from modules.prompt_loader import PromptLoader
+
+PROMPTS_DIR = Path("config/prompts")
+OUTPUT = Path("modules/_baked_prompts.py")
+
+
+def bake() -> int:
+    """Write every prompt file to OUTPUT and return how many were baked."""
+    prompts = {}
+    for path in sorted(PROMPTS_DIR.glob("*.y*ml")):
+        # Read the file itself: load_prompt would return the previously baked
+        # entry for this key and write the stale prompt back
+        resolved = path.resolve()
+        stat = resolved.stat()
+        prompts[path.as_posix()] = PromptLoader._read_prompt(
+            str(resolved), stat.st_mtime_ns, stat.st_size
+        )
+    lines = [
+        '"""Generated by bake_prompts.py; do not edit."""',
+        "PROMPTS: dict[str, str] = {",
+        *(f"    {key!r}: {prompt!r}," for key, prompt in prompts.items()),
+        "}",
+        "",
+    ]
+    OUTPUT.write_text("\n".join(lines), encoding="utf-8")
+    return len(prompts)
+
+
+if __name__ == "__main__":
+    count = bake()
+    print(f"✅ Baked {count} prompt(s) into {OUTPUT}")
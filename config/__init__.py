@@ -1 +1,13 @@
-from .config import *
\ No newline at end of file
+from functools import lru_cache
+
+from .config import *
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> ApplicationSettings:
+    """Process-wide application settings, parsed once and reused across requests.
+
+    Call ``reload_env()`` and ``get_settings.cache_clear()`` to reload; the
+    API does both (and rebuilds its LiveKit client) on SIGHUP.
+    """
+    return ApplicationSettings.from_cfg('config/config.yml')
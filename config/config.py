@@ -1,69 +1,86 @@
-from typing import Optional, Literal, Dict, Any
+import os
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Optional, Literal, Dict, Any, Mapping
 from pathlib import Path
 
+from dotenv import dotenv_values
+
 from pydantic_settings import BaseSettings
 from pydantic import BaseModel, model_validator, Field
 
 from utils.logger import LOGGER
 from utils import load_yaml
+from modules.prompt_loader import PromptLoader
+
+# Checked once at import time instead of stat-ing both files on every load()
+_ENV_LOADED = any(Path(p).exists() for p in (".env.prod", ".env.local"))
 
-def load():    
-    LOGGER.info("Attempting to load from .env.{PROD | LOCAL} file")
-    # 1. Try local .env
-    env_file_prod = Path(".env.prod")
-    env_file_local = Path(".env.local")
-    if env_file_prod.exists() | env_file_local.exists():
+def load():
+    if _ENV_LOADED:
         return
 
     raise Exception('Unable to load secrets')
 
+# Dotenv files are parsed once per process (and again by reload_env); later
+# sources take precedence (.env.local over .env.prod, real environment
+# variables over both)
+def _read_env() -> Mapping[str, str]:
+    return MappingProxyType({
+        key: value
+        for source in (dotenv_values(".env.prod"), dotenv_values(".env.local"), os.environ)
+        for key, value in source.items()
+        if value is not None
+    })
+
+_ENV: Mapping[str, str] = _read_env()
+
+def _from_env(cls):
+    """Instantiate a settings class from the process-wide environment snapshot."""
+    return cls(**{key: _ENV[key] for key in cls.model_fields if key in _ENV})
+
 class OpenAISettings(BaseSettings):
     OPENAI_API_KEY: str
     class Config:
-        env_file = '.env.prod', '.env.local'
         extra = "ignore"
 
-    @classmethod
-    def load(cls) -> "OpenAISettings":
-        secrets = load()
-        if secrets:
-            return cls(**secrets)
-        else:
-            return cls()
-
 class DeepGramSettings(BaseSettings):
     DEEPGRAM_API_KEY: str
     class Config:
-        env_file = '.env.prod', '.env.local'
         extra = "ignore"
-
-    @classmethod
-    def load(cls) -> "DeepGramSettings":
-        secrets = load()
-        if secrets:
-            return cls(**secrets)
-        else:
-            return cls()
         
 class CartesiaSettings(BaseSettings):
     CARTESIA_API_KEY: str
     class Config:
-        env_file = '.env.prod', '.env.local'
         extra = "ignore"
 
-    @classmethod
-    def load(cls) -> "CartesiaSettings":
-        secrets = load()
-        if secrets:
-            return cls(**secrets)
-        else:
-            return cls()
+# Secrets are read once per process; the API_KEY properties below hit these caches
+@lru_cache(maxsize=None)
+def _openai_settings() -> OpenAISettings:
+    load()
+    return _from_env(OpenAISettings)
+
+@lru_cache(maxsize=None)
+def _deepgram_settings() -> DeepGramSettings:
+    load()
+    return _from_env(DeepGramSettings)
+
+@lru_cache(maxsize=None)
+def _cartesia_settings() -> CartesiaSettings:
+    load()
+    return _from_env(CartesiaSettings)
+
+def reload_env() -> None:
+    """Re-read the dotenv files and drop the cached secrets."""
+    global _ENV
+    _ENV = _read_env()
+    for settings in (_openai_settings, _deepgram_settings, _cartesia_settings):
+        settings.cache_clear()
 
 class LLMSettings(BaseModel):
     type: Literal['openai'] = Field(..., exclude=True)
     model: str
     temperature: float = Field(default=0.3)
-    __settings: Optional[OpenAISettings] = None
     # verbose: bool = True
 
     @model_validator(mode="after")
@@ -74,9 +91,7 @@ class LLMSettings(BaseModel):
 
     @property
     def API_KEY(self):
-        if not self.__settings:
-            self.__settings = OpenAISettings.load()
-        return self.__settings.OPENAI_API_KEY
+        return _openai_settings().OPENAI_API_KEY
 
 
 class STTDeepGramSettings(BaseModel):
@@ -84,7 +99,6 @@ class STTDeepGramSettings(BaseModel):
     model: str
     language: Literal["en", "multi"]
     base_url: str = Field(default="https://api.deepgram.com/v1/listen")
-    __settings: Optional[DeepGramSettings] = None
 
     @model_validator(mode="after")
     def check_keys(self):
@@ -94,9 +108,7 @@ class STTDeepGramSettings(BaseModel):
 
     @property
     def API_KEY(self):
-        if not self.__settings:
-            self.__settings = DeepGramSettings.load()
-        return self.__settings.DEEPGRAM_API_KEY
+        return _deepgram_settings().DEEPGRAM_API_KEY
     
 class TTSCartesiaSettings(BaseModel):
     type: Literal["cartesia"] = Field(..., exclude=True)
@@ -104,7 +116,6 @@ class TTSCartesiaSettings(BaseModel):
     language: Literal["en"]
     voice: str = Field(default="6f84f4b8-58a2-430c-8c79-688dad597532")
     base_url: str = Field(default="https://api.cartesia.ai")
-    __settings: Optional[CartesiaSettings] = None
 
     @model_validator(mode="after")
     def check_keys(self):
@@ -114,9 +125,18 @@ class TTSCartesiaSettings(BaseModel):
 
     @property
     def API_KEY(self):
-        if not self.__settings:
-            self.__settings = CartesiaSettings.load()
-        return self.__settings.CARTESIA_API_KEY
+        return _cartesia_settings().CARTESIA_API_KEY
+
+
+class SemanticCacheSettings(BaseModel):
+    """Reuse replies to questions close in meaning to ones already answered."""
+    enabled: bool = False
+    db_path: str = "semantic_cache.db"
+    # Minimum cosine similarity between utterance embeddings for a hit
+    threshold: float = 0.92
+    # Shorter utterances ("yes", "that's right") depend on the conversation
+    # so far and are never cached
+    min_words: int = 4
 
 
 class LiveKitSettings(BaseSettings):
@@ -126,13 +146,12 @@ class LiveKitSettings(BaseSettings):
     LIVEKIT_API_SECRET: str = Field(..., description="LiveKit API secret")
     
     class Config:
-        env_file = '.env.prod', '.env.local'
         extra = "ignore"
     
     @classmethod
     def load(cls) -> "LiveKitSettings":
         """Load LiveKit settings from environment."""
-        return cls()
+        return _from_env(cls)
 
 
 class MCPServerConfig(BaseModel):
@@ -148,6 +167,11 @@ class UseCaseConfig(BaseModel):
     mcp_servers: list[MCPServerConfig] = Field(default_factory=list)
     prompt_file: str
 
+    @property
+    def prompt_text(self) -> str:
+        """Prompt contents, served from memory unless the file changed on disk."""
+        return PromptLoader.load_prompt(self.prompt_file)
+
 
 class UseCaseSettings(BaseModel):
     """Settings for use case selection and configuration."""
@@ -169,12 +193,18 @@ class ApplicationSettings(BaseModel):
     llm: LLMSettings
     stt: STTDeepGramSettings
     tts: TTSCartesiaSettings
+    semantic_cache: SemanticCacheSettings = Field(default_factory=SemanticCacheSettings)
     livekit: Optional[LiveKitSettings] = None
     
     @property
     def current_use_case(self) -> UseCaseConfig:
         """Get the current use case configuration."""
         return self.use_case_settings.get_current_config()
+
+    @cached_property
+    def llm_kwargs(self) -> Dict[str, Any]:
+        """LLM constructor options, dumped once per settings instance."""
+        return self.llm.model_dump()
     
     @classmethod
     def from_cfg(cls, cfg: str | dict) -> "ApplicationSettings":
@@ -185,6 +215,8 @@ class ApplicationSettings(BaseModel):
         # create a default hospitality configuration
         if "use_case_settings" not in cfg:
             LOGGER.warning("No use_case_settings found, using default hospitality configuration")
+            # Copy rather than mutate: load_yaml hands out its cached dict
+            cfg = dict(cfg)
             cfg["use_case_settings"] = {
                 "use_case": "hospitality",
                 "use_cases": {
@@ -202,5 +234,5 @@ class ApplicationSettings(BaseModel):
         try:
             settings.livekit = LiveKitSettings.load()
         except Exception as e:
-            LOGGER.warning(f"Failed to load LiveKit settings: {e}")
+            LOGGER.warning("Failed to load LiveKit settings: %s", e)
         return settings
\ No newline at end of file
@@ -1,57 +1,85 @@
 """LiveKit agent entrypoint - works with any use case."""
-from pathlib import Path
-from dotenv import load_dotenv
+import os
+
+from utils import load_env
 
 # Load environment variables BEFORE importing LiveKit
 # LiveKit reads LIVEKIT_API_KEY and LIVEKIT_API_SECRET during initialization
-env_file = Path(".env.local")
-if not env_file.exists():
-    env_file = Path(".env.prod")
-if env_file.exists():
-    load_dotenv(env_file, override=True)
-else:
-    # Fallback to default .env loading
-    load_dotenv(override=True)
-
-from livekit.agents import JobContext
+load_env(override=True)
+
+from livekit.agents import JobContext, JobProcess, Worker
 from livekit.agents import cli, WorkerOptions
 from livekit.plugins import silero
+from livekit.plugins.turn_detector.multilingual import MultilingualModel
 
-from config import ApplicationSettings
-from modules.agent import GenericAssistant, HospitalityAssistant  # Backward compatibility
+from config import get_settings
+from modules.agent import GenericAssistant
 from utils.logger import LOGGER
 
+# Jobs a worker runs at once. At this many the worker reports itself full and
+# LiveKit dispatches new rooms to other workers, so a burst of rooms doesn't
+# hit the providers' rate limits all together
+MAX_CONCURRENT_JOBS = int(os.getenv("MAX_CONCURRENT_JOBS", "8"))
+
+
+def load(worker: Worker) -> float:
+    """Worker load as the share of MAX_CONCURRENT_JOBS in use."""
+    return len(worker.active_jobs) / MAX_CONCURRENT_JOBS
+
+
+def worker_options() -> WorkerOptions:
+    """Options for the agent worker, shared by this module and main.py."""
+    return WorkerOptions(
+        entrypoint_fnc=entrypoint,
+        prewarm_fnc=prewarm,
+        load_fnc=load,
+        load_threshold=1.0,
+    )
+
+
+def prewarm(proc: JobProcess):
+    """
+    Load models once per worker process so every job can reuse them.
+    """
+    # Initialize VAD (Voice Activity Detection) and store in userdata
+    # This is required by the agent session
+    proc.userdata["vad"] = silero.VAD.load()
+    # Turn detector shared by every session in this process
+    proc.userdata["turn_detector"] = MultilingualModel()
+
+    # Parse the configuration and read the use case prompt before the first job
+    try:
+        get_settings().current_use_case.prompt_text
+    except Exception as e:
+        LOGGER.warning("Failed to preload configuration: %s", e)
+
+
 async def entrypoint(ctx: JobContext):
     """
     Entrypoint function for LiveKit agent - works with any use case.
     This function is called when a new job starts.
     """
     try:
-        # Load configuration
-        settings = ApplicationSettings.from_cfg('config/config.yml')
+        # Load configuration (parsed once per worker process)
+        settings = get_settings()
         use_case = settings.use_case_settings.use_case
         use_case_name = settings.current_use_case.name
         
-        LOGGER.info(f"Starting {use_case_name} for room: {ctx.room.name} (use case: {use_case})")
-        
-        # Initialize VAD (Voice Activity Detection) and store in userdata
-        # This is required by the agent session
-        vad = silero.VAD.load()
-        ctx.proc.userdata["vad"] = vad
+        LOGGER.info("Starting %s for room: %s (use case: %s)", use_case_name, ctx.room.name, use_case)
         
         # Create and start the assistant (works for any use case)
-        assistant = GenericAssistant(cfg=settings, ctx=ctx)
+        assistant = await GenericAssistant.create(cfg=settings, ctx=ctx)
         await assistant.start()
         
-        LOGGER.info(f"{use_case_name} started successfully for room: {ctx.room.name}")
+        LOGGER.info("%s started successfully for room: %s", use_case_name, ctx.room.name)
         
     except Exception as e:
-        LOGGER.error(f"Failed to start assistant: {e}")
+        LOGGER.error("Failed to start assistant: %s", e)
         raise
 
 
 if __name__ == "__main__":
     # Run the agent with LiveKit CLI
     # The entrypoint function will be called for each new job
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
+    cli.run_app(worker_options())
 
@@ -1,20 +1,11 @@
 """Main entry point for the hospitality bot application."""
 import argparse
+import os
 import sys
-import uvicorn
-from pathlib import Path
-from dotenv import load_dotenv
+from utils import load_env
 
-# Load environment variables before importing LiveKit
-env_file = Path(".env.local")
-if not env_file.exists():
-    env_file = Path(".env.prod")
-if env_file.exists():
-    load_dotenv(env_file)
-else:
-    load_dotenv()
-
-from livekit.agents import cli, WorkerOptions
+# Load environment variables before LiveKit is imported
+load_env()
 
 from config import ApplicationSettings
 from utils.logger import LOGGER
@@ -22,21 +13,33 @@ from utils.logger import LOGGER
 
 def run_fastapi(host: str = "0.0.0.0", port: int = 8000):
     """Run the FastAPI server for agent management."""
-    LOGGER.info(f"Starting FastAPI server on {host}:{port}")
+    # Imported here so the agent mode never pays for loading uvicorn
+    import uvicorn
+
+    workers = int(os.getenv("API_WORKERS", "1"))
+    LOGGER.info("Starting FastAPI server on %s:%s with %s worker(s)", host, port, workers)
     uvicorn.run(
         "api.app:app",
         host=host,
         port=port,
-        log_level="info",
+        # uvloop is not available on Windows; uvicorn falls back to asyncio there
+        loop="uvloop" if sys.platform != "win32" else "auto",
+        http="httptools",
+        workers=workers,
+        # Per-request access logs are skipped in the hot path
+        log_level="warning",
         reload=False
     )
 
 
 def run_agent():
     """Run the LiveKit agent entrypoint."""
-    from entrypoint import entrypoint
+    # Imported here so the API mode never pays for loading livekit.agents
+    from livekit.agents import cli
+    from entrypoint import worker_options
+
     LOGGER.info("Starting LiveKit agent entrypoint")
-    cli.run_app(WorkerOptions(entrypoint_fnc=entrypoint))
+    cli.run_app(worker_options())
 
 
 def main():
@@ -74,7 +77,7 @@ def main():
         elif args.mode == "api":
             run_fastapi(host=args.host, port=args.port)
     except Exception as e:
-        LOGGER.error(f"Failed to start application: {e}")
+        LOGGER.error("Failed to start application: %s", e)
         sys.exit(1)
 
 
@@ -10,8 +10,6 @@ demonstrates:
 ---
 """
 from mcp.server.fastmcp import FastMCP
-import asyncio
-import concurrent.futures
 
 mcp = FastMCP("Medical MCP", host="0.0.0.0", port=8002)
 
@@ -22,23 +20,8 @@ from mcp_server.appointment_service import AppointmentService
 appointment_service = AppointmentService()
 
 
-def run_async(coroutine):
-    """
-    Helper function to run a coroutine either in the current loop or a new one
-    """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coroutine)
-                return future.result()
-        else:
-            return loop.run_until_complete(coroutine)
-    except RuntimeError:
-        return asyncio.run(coroutine)
-
 @mcp.tool()
-def save_appointment_record(patient_name: str,
+async def save_appointment_record(patient_name: str,
         appointment_date: str,
         appointment_time: str,
         doctor_name: str = "",
@@ -74,18 +57,18 @@ def save_appointment_record(patient_name: str,
             "symptoms": symptoms
         }
         
+        # The save only buffers the row; the CSV commit thread does the disk I/O
         result = appointment_service.save_appointment(appointment_details)
         
         if result["success"]:
-            LOGGER.info(f"Appointment scheduled successfully: {result['appointment_id']}")
+            LOGGER.info("Appointment scheduled successfully: %s", result['appointment_id'])
             return f"Your appointment has been successfully scheduled! Your appointment ID is {result['appointment_id']}. Please arrive 15 minutes before your scheduled time."
         else:
-            LOGGER.error(f"Appointment scheduling failed: {result.get('error')}")
+            LOGGER.error("Appointment scheduling failed: %s", result.get('error'))
             return "I apologize, but there was an issue processing your appointment request. Please try again or contact our reception directly."
             
     except Exception as e:
-        error_msg = f"Exception during appointment scheduling: {str(e)}"
-        LOGGER.error(error_msg)
+        LOGGER.error("Exception during appointment scheduling: %s", e)
         return "I apologize, but there was an error processing your appointment. Please try again."
 
 
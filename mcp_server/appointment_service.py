@@ -1,14 +1,18 @@
 """Service for handling medical appointments and saving to CSV."""
 import csv
-import os
-from datetime import datetime
+import itertools
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from utils.logger import LOGGER
+from mcp_server.csv_writer import BufferedCSVWriter
 
 
 class AppointmentService:
     """Service to handle medical appointment operations and CSV storage."""
+
+    # Fields an appointment cannot be saved without
+    _REQUIRED: tuple[str, ...] = ("patient_name", "appointment_date", "appointment_time")
     
     def __init__(self, csv_file_path: str = "appointments.csv"):
         """
@@ -32,6 +36,25 @@ class AppointmentService:
             "status"
         ]
         self._ensure_csv_exists()
+        # Rows are buffered and appended in batches
+        self._writer = BufferedCSVWriter(self.csv_file_path, self.fieldnames)
+        # ID and timestamp prefixes are re-rendered at most once per second;
+        # the counter keeps IDs unique within that second
+        self._stamps = (0, "", "")
+        self._id_counter = itertools.count()
+    
+    def _next_id(self, now: float) -> Tuple[str, str]:
+        """Generate a unique appointment ID and an ISO timestamp for ``now``."""
+        second = int(now)
+        if second != self._stamps[0]:
+            local = time.localtime(second)
+            self._stamps = (
+                second,
+                time.strftime('%Y%m%d%H%M%S', local),
+                time.strftime('%Y-%m-%dT%H:%M:%S', local),
+            )
+        _, compact, iso = self._stamps
+        return f"APT{compact}{next(self._id_counter):04d}", f"{iso}.{int((now - second) * 1_000_000):06d}"
     
     def _ensure_csv_exists(self):
         """Ensure the CSV file exists with headers if it doesn't."""
@@ -39,7 +62,7 @@ class AppointmentService:
             with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.DictWriter(file, fieldnames=self.fieldnames)
                 writer.writeheader()
-            LOGGER.info(f"Created appointments CSV file at {self.csv_file_path}")
+            LOGGER.info("Created appointments CSV file at %s", self.csv_file_path)
     
     def save_appointment(self, appointment_details: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -60,8 +83,20 @@ class AppointmentService:
             Dictionary with appointment_id and status
         """
         try:
-            # Generate appointment ID
-            appointment_id = f"APT{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            # Validate required fields
+            missing_fields = [field for field in self._REQUIRED if not appointment_details.get(field)]
+            
+            if missing_fields:
+                error_msg = f"Missing required fields: {', '.join(missing_fields)}"
+                LOGGER.error(error_msg)
+                return {
+                    "success": False,
+                    "error": error_msg,
+                    "appointment_id": None
+                }
+            
+            # Generate appointment ID and timestamp from a single clock read
+            appointment_id, timestamp = self._next_id(time.time())
             
             # Prepare appointment record
             appointment_record = {
@@ -74,29 +109,14 @@ class AppointmentService:
                 "contact_phone": appointment_details.get("contact_phone", ""),
                 "contact_email": appointment_details.get("contact_email", ""),
                 "symptoms": appointment_details.get("symptoms", ""),
-                "appointment_timestamp": datetime.now().isoformat(),
+                "appointment_timestamp": timestamp,
                 "status": "Scheduled"
             }
             
-            # Validate required fields
-            required_fields = ["patient_name", "appointment_date", "appointment_time"]
-            missing_fields = [field for field in required_fields if not appointment_record.get(field)]
+            # Queue for the next batched append to CSV
+            self._writer.append(appointment_record)
             
-            if missing_fields:
-                error_msg = f"Missing required fields: {', '.join(missing_fields)}"
-                LOGGER.error(error_msg)
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "appointment_id": None
-                }
-            
-            # Append to CSV
-            with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=self.fieldnames)
-                writer.writerow(appointment_record)
-            
-            LOGGER.info(f"Appointment saved successfully: {appointment_id} for {appointment_record['patient_name']}")
+            LOGGER.info("Appointment saved successfully: %s for %s", appointment_id, appointment_record['patient_name'])
             
             return {
                 "success": True,
@@ -114,6 +134,14 @@ class AppointmentService:
                 "appointment_id": None
             }
     
+    def flush(self) -> None:
+        """Write any buffered appointments to the CSV file."""
+        self._writer.flush()
+
+    def commit(self) -> None:
+        """Write any buffered appointments to the CSV file and fsync it."""
+        self._writer.commit()
+    
     def get_appointment(self, appointment_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve an appointment by ID from CSV.
@@ -125,15 +153,8 @@ class AppointmentService:
             Dictionary with appointment details or None if not found
         """
         try:
-            if not self.csv_file_path.exists():
-                return None
-            
-            with open(self.csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row.get("appointment_id") == appointment_id:
-                        return row
-            return None
+            # Indexed lookup; buffered rows are flushed first so they are visible
+            return self._writer.get(appointment_id)
         except Exception as e:
-            LOGGER.error(f"Error retrieving appointment {appointment_id}: {str(e)}")
+            LOGGER.error("Error retrieving appointment %s: %s", appointment_id, e)
             return None
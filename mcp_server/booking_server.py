@@ -10,8 +10,6 @@ demonstrates:
 ---
 """
 from mcp.server.fastmcp import FastMCP
-import asyncio
-import concurrent.futures
 
 mcp = FastMCP("Hospitality MCP", host="0.0.0.0", port=8001)
 
@@ -22,23 +20,8 @@ from mcp_server.booking_service import BookingService
 booking_service = BookingService()
 
 
-def run_async(coroutine):
-    """
-    Helper function to run a coroutine either in the current loop or a new one
-    """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coroutine)
-                return future.result()
-        else:
-            return loop.run_until_complete(coroutine)
-    except RuntimeError:
-        return asyncio.run(coroutine)
-
 @mcp.tool()
-def save_booking_record(guest_name: str,
+async def save_booking_record(guest_name: str,
         check_in_date: str,
         check_out_date: str,
         number_of_guests: int,
@@ -63,29 +46,21 @@ def save_booking_record(guest_name: str,
         Dictionary with booking confirmation details
     """
     try:
-        booking_details = {
-            "guest_name": guest_name,
-            "check_in_date": check_in_date,
-            "check_out_date": check_out_date,
-            "number_of_guests": number_of_guests,
-            "room_type": room_type,
-            "contact_phone": contact_phone,
-            "contact_email": contact_email,
-            "special_requests": special_requests
-        }
-        
-        result = booking_service.save_booking(booking_details)
+        # The save only buffers the row; the CSV commit thread does the disk I/O
+        result = booking_service.save_booking_positional(
+            guest_name, check_in_date, check_out_date, number_of_guests,
+            room_type, contact_phone, contact_email, special_requests
+        )
         
         if result["success"]:
-            LOGGER.info(f"Room booking successful: {result['booking_id']}")
+            LOGGER.info("Room booking successful: %s", result['booking_id'])
             return f"Your room has been successfully booked! Your booking ID is {result['booking_id']}. We look forward to welcoming you to Al Faisaliah Grand Hotel."
         else:
-            LOGGER.error(f"Room booking failed: {result.get('error')}")
+            LOGGER.error("Room booking failed: %s", result.get('error'))
             return "I apologize, but there was an issue processing your booking. Please try again or contact our reservations team directly."
             
     except Exception as e:
-        error_msg = f"Exception during room booking: {str(e)}"
-        LOGGER.error(error_msg)
+        LOGGER.error("Exception during room booking: %s", e)
         return "I apologize, but there was an error processing your booking. Please try again."
 
 
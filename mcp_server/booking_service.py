@@ -1,14 +1,18 @@
 """Service for handling room bookings and saving to CSV."""
 import csv
-import os
-from datetime import datetime
+import itertools
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from utils.logger import LOGGER
+from mcp_server.csv_writer import BufferedCSVWriter
 
 
 class BookingService:
     """Service to handle room booking operations and CSV storage."""
+
+    # Fields a booking cannot be saved without
+    _REQUIRED: tuple[str, ...] = ("guest_name", "check_in_date", "check_out_date", "number_of_guests")
     
     def __init__(self, csv_file_path: str = "bookings.csv"):
         """
@@ -32,6 +36,25 @@ class BookingService:
             "status"
         ]
         self._ensure_csv_exists()
+        # Rows are buffered and appended in batches
+        self._writer = BufferedCSVWriter(self.csv_file_path, self.fieldnames)
+        # ID and timestamp prefixes are re-rendered at most once per second;
+        # the counter keeps IDs unique within that second
+        self._stamps = (0, "", "")
+        self._id_counter = itertools.count()
+    
+    def _next_id(self, now: float) -> Tuple[str, str]:
+        """Generate a unique booking ID and an ISO timestamp for ``now``."""
+        second = int(now)
+        if second != self._stamps[0]:
+            local = time.localtime(second)
+            self._stamps = (
+                second,
+                time.strftime('%Y%m%d%H%M%S', local),
+                time.strftime('%Y-%m-%dT%H:%M:%S', local),
+            )
+        _, compact, iso = self._stamps
+        return f"BK{compact}{next(self._id_counter):04d}", f"{iso}.{int((now - second) * 1_000_000):06d}"
     
     def _ensure_csv_exists(self):
         """Ensure the CSV file exists with headers if it doesn't."""
@@ -39,7 +62,7 @@ class BookingService:
             with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.DictWriter(file, fieldnames=self.fieldnames)
                 writer.writeheader()
-            LOGGER.info(f"Created bookings CSV file at {self.csv_file_path}")
+            LOGGER.info("Created bookings CSV file at %s", self.csv_file_path)
     
     def save_booking(self, booking_details: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -56,31 +79,51 @@ class BookingService:
                 - contact_email (optional)
                 - special_requests (optional)
         
+        Returns:
+            Dictionary with booking_id and status
+        """
+        return self.save_booking_positional(
+            booking_details.get("guest_name", ""),
+            booking_details.get("check_in_date", ""),
+            booking_details.get("check_out_date", ""),
+            booking_details.get("number_of_guests", ""),
+            booking_details.get("room_type", "Standard"),
+            booking_details.get("contact_phone", ""),
+            booking_details.get("contact_email", ""),
+            booking_details.get("special_requests", ""),
+        )
+    
+    def save_booking_positional(
+        self,
+        guest_name: str,
+        check_in_date: str,
+        check_out_date: str,
+        number_of_guests: Any,
+        room_type: str = "Standard",
+        contact_phone: str = "",
+        contact_email: str = "",
+        special_requests: str = "",
+    ) -> Dict[str, Any]:
+        """
+        Save a booking from individual fields, without an intermediate details dict.
+        
+        Args:
+            guest_name: Full name of the guest (required)
+            check_in_date: Check-in date (required)
+            check_out_date: Check-out date (required)
+            number_of_guests: Number of guests staying (required)
+            room_type: Type of room
+            contact_phone: Contact phone number
+            contact_email: Contact email address
+            special_requests: Any special requests or preferences
+        
         Returns:
             Dictionary with booking_id and status
         """
         try:
-            # Generate booking ID
-            booking_id = f"BK{datetime.now().strftime('%Y%m%d%H%M%S')}"
-            
-            # Prepare booking record
-            booking_record = {
-                "booking_id": booking_id,
-                "guest_name": booking_details.get("guest_name", ""),
-                "check_in_date": booking_details.get("check_in_date", ""),
-                "check_out_date": booking_details.get("check_out_date", ""),
-                "number_of_guests": str(booking_details.get("number_of_guests", "")),
-                "room_type": booking_details.get("room_type", "Standard"),
-                "contact_phone": booking_details.get("contact_phone", ""),
-                "contact_email": booking_details.get("contact_email", ""),
-                "special_requests": booking_details.get("special_requests", ""),
-                "booking_timestamp": datetime.now().isoformat(),
-                "status": "Confirmed"
-            }
-            
             # Validate required fields
-            required_fields = ["guest_name", "check_in_date", "check_out_date", "number_of_guests"]
-            missing_fields = [field for field in required_fields if not booking_record.get(field)]
+            required = (guest_name, check_in_date, check_out_date, number_of_guests)
+            missing_fields = [field for field, value in zip(self._REQUIRED, required) if not value]
             
             if missing_fields:
                 error_msg = f"Missing required fields: {', '.join(missing_fields)}"
@@ -91,12 +134,28 @@ class BookingService:
                     "booking_id": None
                 }
             
-            # Append to CSV
-            with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=self.fieldnames)
-                writer.writerow(booking_record)
+            # Generate booking ID and timestamp from a single clock read
+            booking_id, timestamp = self._next_id(time.time())
+            
+            # Prepare booking record
+            booking_record = {
+                "booking_id": booking_id,
+                "guest_name": guest_name,
+                "check_in_date": check_in_date,
+                "check_out_date": check_out_date,
+                "number_of_guests": str(number_of_guests),
+                "room_type": room_type,
+                "contact_phone": contact_phone,
+                "contact_email": contact_email,
+                "special_requests": special_requests,
+                "booking_timestamp": timestamp,
+                "status": "Confirmed"
+            }
             
-            LOGGER.info(f"Booking saved successfully: {booking_id} for {booking_record['guest_name']}")
+            # Queue for the next batched append to CSV
+            self._writer.append(booking_record)
+            
+            LOGGER.info("Booking saved successfully: %s for %s", booking_id, booking_record['guest_name'])
             
             return {
                 "success": True,
@@ -114,6 +173,14 @@ class BookingService:
                 "booking_id": None
             }
     
+    def flush(self) -> None:
+        """Write any buffered bookings to the CSV file."""
+        self._writer.flush()
+
+    def commit(self) -> None:
+        """Write any buffered bookings to the CSV file and fsync it."""
+        self._writer.commit()
+    
     def get_booking(self, booking_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve a booking by ID from CSV.
@@ -125,16 +192,9 @@ class BookingService:
             Dictionary with booking details or None if not found
         """
         try:
-            if not self.csv_file_path.exists():
-                return None
-            
-            with open(self.csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row.get("booking_id") == booking_id:
-                        return row
-            return None
+            # Indexed lookup; buffered rows are flushed first so they are visible
+            return self._writer.get(booking_id)
         except Exception as e:
-            LOGGER.error(f"Error retrieving booking {booking_id}: {str(e)}")
+            LOGGER.error("Error retrieving booking %s: %s", booking_id, e)
             return None
 
@@ -0,0 +1,27 @@
+"""
+Single MCP server exposing the booking, appointment and enrollment tools.
+
+Serves all three record tools from one FastMCP instance, so one process, event
+loop and SSE endpoint replace the three servers on ports 8001-8003. Point each
+use case's ``mcp_servers`` URL at ``http://localhost:8001/sse`` to use it.
+"""
+from mcp.server.fastmcp import FastMCP
+
+from mcp_server.appointment_server import save_appointment_record
+from mcp_server.booking_server import save_booking_record
+from mcp_server.enrollment_server import save_enrollment_record
+
+mcp = FastMCP("Services MCP", host="0.0.0.0", port=8001)
+
+for tool in (save_booking_record, save_appointment_record, save_enrollment_record):
+    mcp.add_tool(tool)
+
+# ASGI app for running under uvicorn directly:
+#   uvicorn mcp_server.combined_server:app --port 8001 --loop uvloop --http httptools
+# Keep a single worker: SSE sessions and the CSV writers' buffers and row
+# indexes live in process memory.
+app = mcp.sse_app()
+
+
+if __name__ == "__main__":
+    mcp.run(transport="sse")
@@ -0,0 +1,330 @@
+"""Buffered CSV writer shared by the MCP record services."""
+import atexit
+import csv
+import operator
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Set, Tuple
+
+from utils.logger import LOGGER
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+
+# Buffer size for the start-up index scan
+_BUFFER_SIZE = 1 << 20
+
+_APPEND_FLAGS = os.O_WRONLY | os.O_APPEND | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+
+
+def _quote(value: str) -> str:
+    """Quote a CSV field the way csv.QUOTE_MINIMAL would."""
+    if ',' in value or '"' in value or '\n' in value or '\r' in value:
+        return '"' + value.replace('"', '""') + '"'
+    return value
+
+
+def _iter_rows(file: BinaryIO) -> Iterator[Tuple[int, List[str]]]:
+    """Yield (byte offset, row) for each CSV record, including multi-line quoted fields."""
+    line_offsets: List[int] = []
+
+    def lines() -> Iterator[str]:
+        while True:
+            offset = file.tell()
+            line = file.readline()
+            if not line:
+                return
+            line_offsets.append(offset)
+            yield line.decode('utf-8')
+
+    consumed = 0
+    for row in csv.reader(lines()):
+        yield line_offsets[consumed], row
+        consumed = len(line_offsets)
+
+
+class _CommitThread:
+    """
+    Background thread that flushes the pending rows of every CSV writer.
+
+    Writers schedule themselves when they go from empty to non-empty; the
+    thread then waits one coalescing window (cut short when a writer fills up)
+    and flushes all scheduled writers together. The window is tuned from an
+    EWMA of flush latency: slow flushes widen it so more rows share a write,
+    fast ones narrow it back down. A writer whose flush fails is scheduled
+    again after an exponential backoff.
+    """
+
+    TARGET_LATENCY = 0.002
+    MIN_WINDOW = 0.001
+    MAX_WINDOW = 0.05
+    ALPHA = 0.2
+    MIN_RETRY_DELAY = 0.1
+    MAX_RETRY_DELAY = 5.0
+
+    def __init__(self, window: float = 0.005):
+        self.window = window
+        self.latency = self.TARGET_LATENCY
+        self._lock = threading.Lock()
+        self._scheduled: Set["BufferedCSVWriter"] = set()
+        self._pending = threading.Event()
+        self._full = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def schedule(self, writer: "BufferedCSVWriter", full: bool = False) -> None:
+        """Queue a writer for the next flush; ``full`` flushes without waiting out the window."""
+        with self._lock:
+            self._scheduled.add(writer)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="csv-commit", daemon=True)
+                self._thread.start()
+        self._pending.set()
+        if full:
+            self._full.set()
+
+    def _run(self) -> None:
+        while True:
+            self._pending.wait()
+            self._full.wait(self.window)
+            with self._lock:
+                writers, self._scheduled = self._scheduled, set()
+                self._pending.clear()
+                self._full.clear()
+
+            started = time.perf_counter()
+            for writer in writers:
+                try:
+                    writer.flush()
+                    writer.retry_delay = 0.0
+                except Exception as e:
+                    # One failing writer must not stop the thread every writer shares.
+                    # Rows stay pending and are retried after a backoff
+                    LOGGER.error("Failed to append to %s: %s", writer.csv_file_path, e)
+                    self._retry(writer)
+            self._tune(time.perf_counter() - started)
+
+    def _retry(self, writer: "BufferedCSVWriter") -> None:
+        writer.retry_delay = min(max(writer.retry_delay * 2, self.MIN_RETRY_DELAY), self.MAX_RETRY_DELAY)
+        timer = threading.Timer(writer.retry_delay, self.schedule, (writer,))
+        timer.daemon = True
+        timer.start()
+
+    def _tune(self, elapsed: float) -> None:
+        self.latency += self.ALPHA * (elapsed - self.latency)
+        if self.latency > self.TARGET_LATENCY:
+            self.window = min(self.window * 1.5, self.MAX_WINDOW)
+        else:
+            self.window = max(self.window / 1.5, self.MIN_WINDOW)
+
+
+_COMMITTER = _CommitThread()
+
+
+class BufferedCSVWriter:
+    """
+    Coalesce single-row CSV appends into batched writes and index rows by ID.
+
+    Several writers, in this or other processes, may append to the same file:
+    each batch is written under an exclusive ``flock`` and its offset read
+    back from the file size. Rows appended by another writer are not in this
+    writer's index until ``get`` misses and rescans the file. Without
+    ``fcntl`` (Windows) the file must have a single writer.
+    """
+
+    def __init__(
+        self,
+        csv_file_path: Path,
+        fieldnames: List[str],
+        max_pending: int = 1000,
+        max_pending_bytes: int = 256 * 1024,
+    ):
+        """
+        Initialize the writer.
+
+        Args:
+            csv_file_path: Path to the CSV file rows are appended to
+            fieldnames: Column order of the CSV file; the first column is the record ID
+            max_pending: Flush right away once this many rows are buffered
+            max_pending_bytes: Flush right away once the buffered rows reach roughly this size
+        """
+        self.csv_file_path = Path(csv_file_path)
+        self.fieldnames = fieldnames
+        self.max_pending = max_pending
+        self.max_pending_bytes = max_pending_bytes
+        # Encoded rows waiting to be written, as (record ID, CSV line)
+        self._pending: List[Tuple[str, bytes]] = []
+        self._pending_bytes = 0
+        # Seconds before the commit thread retries a failed flush; 0 after a success
+        self.retry_delay = 0.0
+        self._lock = threading.Lock()
+        # Record ID -> byte offset of its row, so lookups avoid scanning the file
+        self._index: Dict[str, int] = {}
+        self._build_index()
+        # One unbuffered append descriptor for the writer's lifetime; each batch
+        # is formatted in memory (so row offsets are known) and written with a
+        # single os.write
+        self._fd: Optional[int] = os.open(self.csv_file_path, _APPEND_FLAGS, 0o644)
+        self._offset = os.lseek(self._fd, 0, os.SEEK_END)
+        # Where the first pending row starts; behind _offset while only part
+        # of that row has been written
+        self._row_start = self._offset
+        # Pulls a record's values out in column order in one call
+        self._values = operator.itemgetter(*self.fieldnames)
+        self._separators = len(self.fieldnames) - 1
+        atexit.register(self.close)
+
+    def _build_index(self) -> None:
+        """Scan the existing CSV file once and record the offset of every row."""
+        if not self.csv_file_path.exists():
+            return
+        with open(self.csv_file_path, 'rb', buffering=_BUFFER_SIZE) as file:
+            rows = _iter_rows(file)
+            next(rows, None)  # header
+            for offset, row in rows:
+                if row and row[0]:
+                    self._index[row[0]] = offset
+
+    def append(self, record: Dict[str, Any]) -> None:
+        """
+        Buffer a record; the shared commit thread writes it in the background.
+
+        Args:
+            record: Row to append; must contain every fieldname
+
+        Raises:
+            KeyError: If a fieldname is missing from ``record``
+            UnicodeEncodeError: If a value cannot be encoded as UTF-8
+        """
+        # Formatted and encoded here, so a bad record fails in the caller
+        # instead of in the commit thread
+        values = self._values(record)
+        data = self._format_row(values).encode('utf-8')
+        with self._lock:
+            self._pending.append((str(values[0]), data))
+            self._pending_bytes += len(data)
+            first = len(self._pending) == 1
+            full = len(self._pending) >= self.max_pending or self._pending_bytes >= self.max_pending_bytes
+        if first or full:
+            _COMMITTER.schedule(self, full=full)
+
+    def flush(self) -> None:
+        """Write all buffered records to the CSV file."""
+        with self._lock:
+            self._flush_locked()
+
+    def commit(self) -> None:
+        """Write all buffered records and fsync the CSV file."""
+        with self._lock:
+            self._flush_locked(sync=True)
+
+    def close(self) -> None:
+        """Flush buffered records and close the file descriptor."""
+        with self._lock:
+            if self._fd is None:
+                return
+            try:
+                self._flush_locked()
+            except OSError as e:
+                LOGGER.error(
+                    "Dropping %d unwritten rows for %s: %s",
+                    len(self._pending), self.csv_file_path, e
+                )
+            finally:
+                os.close(self._fd)
+                self._fd = None
+
+    def get(self, record_id: str) -> Optional[Dict[str, str]]:
+        """
+        Look up a written record by ID.
+
+        Indexed IDs are read with a single seek. An unknown ID rescans the
+        whole file, to pick up rows appended by other writers.
+
+        Args:
+            record_id: Value of the record's first column
+
+        Returns:
+            Dictionary keyed by fieldnames, or None if the ID is unknown
+        """
+        self.flush()
+        offset = self._index.get(record_id)
+        if offset is None:
+            # The ID may be in a row another writer appended; those are only
+            # found by scanning the file again
+            with self._lock:
+                self._build_index()
+            offset = self._index.get(record_id)
+            if offset is None:
+                return None
+        # Single-row read, so the default buffer size is kept here
+        with open(self.csv_file_path, 'rb') as file:
+            file.seek(offset)
+            _, row = next(_iter_rows(file))
+        return dict(zip(self.fieldnames, row))
+
+    def _format_row(self, values: Tuple[Any, ...]) -> str:
+        """Render one row's values as a CSV line."""
+        # None is written as an empty field, as csv.DictWriter did
+        fields = ["" if value is None else str(value) for value in values]
+        line = ",".join(fields)
+        # Fast path: no value needs quoting, so a plain join is valid CSV
+        if line.count(",") == self._separators and '"' not in line and "\n" not in line and "\r" not in line:
+            return line + "\r\n"
+
+        # Slow path: quote only the fields that contain delimiters, quotes or newlines
+        return ",".join([_quote(field) for field in fields]) + "\r\n"
+
+    def _flush_locked(self, sync: bool = False) -> None:
+        if self._fd is None:
+            return
+
+        if self._pending:
+            # O_APPEND makes every os.write land at the current end of file
+            batch = memoryview(b"".join([data for _, data in self._pending]))
+            written = 0
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                while written < len(batch):
+                    written += os.write(self._fd, batch[written:])
+            finally:
+                try:
+                    # Other writers may have appended since the last batch; under
+                    # the lock, the file ends where this batch's bytes end
+                    if written:
+                        start = os.fstat(self._fd).st_size - written
+                        if self._row_start == self._offset:
+                            # No partly written row from an earlier batch
+                            self._row_start = start
+                        self._offset = start
+                finally:
+                    if fcntl is not None:
+                        fcntl.flock(self._fd, fcntl.LOCK_UN)
+                    # Bytes already on disk are never written again, even if a
+                    # later os.write in the batch failed
+                    self._advance(written)
+        if sync:
+            os.fsync(self._fd)
+
+    def _advance(self, written: int) -> None:
+        """Drop ``written`` bytes from the pending rows and index the rows completed."""
+        self._pending_bytes -= written
+        done = 0
+        for record_id, data in self._pending:
+            if written < len(data):
+                break
+            written -= len(data)
+            self._offset += len(data)
+            self._index[record_id] = self._row_start
+            self._row_start = self._offset
+            done += 1
+        del self._pending[:done]
+        if written:
+            self._offset += written
+            # Partly written row: only its remaining bytes stay pending
+            record_id, data = self._pending[0]
+            self._pending[0] = (record_id, data[written:])
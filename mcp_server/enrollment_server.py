@@ -10,8 +10,6 @@ demonstrates:
 ---
 """
 from mcp.server.fastmcp import FastMCP
-import asyncio
-import concurrent.futures
 
 mcp = FastMCP("Education MCP", host="0.0.0.0", port=8003)
 
@@ -22,23 +20,8 @@ from mcp_server.enrollment_service import EnrollmentService
 enrollment_service = EnrollmentService()
 
 
-def run_async(coroutine):
-    """
-    Helper function to run a coroutine either in the current loop or a new one
-    """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coroutine)
-                return future.result()
-        else:
-            return loop.run_until_complete(coroutine)
-    except RuntimeError:
-        return asyncio.run(coroutine)
-
 @mcp.tool()
-def save_enrollment_record(student_name: str,
+async def save_enrollment_record(student_name: str,
         course_name: str,
         enrollment_date: str,
         course_code: str = "",
@@ -80,18 +63,18 @@ def save_enrollment_record(student_name: str,
             "previous_education": previous_education
         }
         
+        # The save only buffers the row; the CSV commit thread does the disk I/O
         result = enrollment_service.save_enrollment(enrollment_details)
         
         if result["success"]:
-            LOGGER.info(f"Enrollment successful: {result['enrollment_id']}")
+            LOGGER.info("Enrollment successful: %s", result['enrollment_id'])
             return f"Your enrollment has been successfully processed! Your enrollment ID is {result['enrollment_id']}. Welcome to {course_name}!"
         else:
-            LOGGER.error(f"Enrollment failed: {result.get('error')}")
+            LOGGER.error("Enrollment failed: %s", result.get('error'))
             return "I apologize, but there was an issue processing your enrollment. Please try again or contact our admissions office directly."
             
     except Exception as e:
-        error_msg = f"Exception during enrollment: {str(e)}"
-        LOGGER.error(error_msg)
+        LOGGER.error("Exception during enrollment: %s", e)
         return "I apologize, but there was an error processing your enrollment. Please try again."
 
 
@@ -1,14 +1,18 @@
 """Service for handling course enrollments and saving to CSV."""
 import csv
-import os
-from datetime import datetime
+import itertools
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from utils.logger import LOGGER
+from mcp_server.csv_writer import BufferedCSVWriter
 
 
 class EnrollmentService:
     """Service to handle course enrollment operations and CSV storage."""
+
+    # Fields an enrollment cannot be saved without
+    _REQUIRED: tuple[str, ...] = ("student_name", "course_name", "enrollment_date")
     
     def __init__(self, csv_file_path: str = "enrollments.csv"):
         """
@@ -34,6 +38,25 @@ class EnrollmentService:
             "status"
         ]
         self._ensure_csv_exists()
+        # Rows are buffered and appended in batches
+        self._writer = BufferedCSVWriter(self.csv_file_path, self.fieldnames)
+        # ID and timestamp prefixes are re-rendered at most once per second;
+        # the counter keeps IDs unique within that second
+        self._stamps = (0, "", "")
+        self._id_counter = itertools.count()
+    
+    def _next_id(self, now: float) -> Tuple[str, str]:
+        """Generate a unique enrollment ID and an ISO timestamp for ``now``."""
+        second = int(now)
+        if second != self._stamps[0]:
+            local = time.localtime(second)
+            self._stamps = (
+                second,
+                time.strftime('%Y%m%d%H%M%S', local),
+                time.strftime('%Y-%m-%dT%H:%M:%S', local),
+            )
+        _, compact, iso = self._stamps
+        return f"ENR{compact}{next(self._id_counter):04d}", f"{iso}.{int((now - second) * 1_000_000):06d}"
     
     def _ensure_csv_exists(self):
         """Ensure the CSV file exists with headers if it doesn't."""
@@ -41,7 +64,7 @@ class EnrollmentService:
             with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.DictWriter(file, fieldnames=self.fieldnames)
                 writer.writeheader()
-            LOGGER.info(f"Created enrollments CSV file at {self.csv_file_path}")
+            LOGGER.info("Created enrollments CSV file at %s", self.csv_file_path)
     
     def save_enrollment(self, enrollment_details: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -64,8 +87,20 @@ class EnrollmentService:
             Dictionary with enrollment_id and status
         """
         try:
-            # Generate enrollment ID
-            enrollment_id = f"ENR{datetime.now().strftime('%Y%m%d%H%M%S')}"
+            # Validate required fields
+            missing_fields = [field for field in self._REQUIRED if not enrollment_details.get(field)]
+            
+            if missing_fields:
+                error_msg = f"Missing required fields: {', '.join(missing_fields)}"
+                LOGGER.error(error_msg)
+                return {
+                    "success": False,
+                    "error": error_msg,
+                    "enrollment_id": None
+                }
+            
+            # Generate enrollment ID and timestamp from a single clock read
+            enrollment_id, timestamp = self._next_id(time.time())
             
             # Prepare enrollment record
             enrollment_record = {
@@ -80,29 +115,14 @@ class EnrollmentService:
                 "contact_phone": enrollment_details.get("contact_phone", ""),
                 "contact_email": enrollment_details.get("contact_email", ""),
                 "previous_education": enrollment_details.get("previous_education", ""),
-                "enrollment_timestamp": datetime.now().isoformat(),
+                "enrollment_timestamp": timestamp,
                 "status": "Enrolled"
             }
             
-            # Validate required fields
-            required_fields = ["student_name", "course_name", "enrollment_date"]
-            missing_fields = [field for field in required_fields if not enrollment_record.get(field)]
+            # Queue for the next batched append to CSV
+            self._writer.append(enrollment_record)
             
-            if missing_fields:
-                error_msg = f"Missing required fields: {', '.join(missing_fields)}"
-                LOGGER.error(error_msg)
-                return {
-                    "success": False,
-                    "error": error_msg,
-                    "enrollment_id": None
-                }
-            
-            # Append to CSV
-            with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=self.fieldnames)
-                writer.writerow(enrollment_record)
-            
-            LOGGER.info(f"Enrollment saved successfully: {enrollment_id} for {enrollment_record['student_name']}")
+            LOGGER.info("Enrollment saved successfully: %s for %s", enrollment_id, enrollment_record['student_name'])
             
             return {
                 "success": True,
@@ -120,6 +140,14 @@ class EnrollmentService:
                 "enrollment_id": None
             }
     
+    def flush(self) -> None:
+        """Write any buffered enrollments to the CSV file."""
+        self._writer.flush()
+
+    def commit(self) -> None:
+        """Write any buffered enrollments to the CSV file and fsync it."""
+        self._writer.commit()
+    
     def get_enrollment(self, enrollment_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve an enrollment by ID from CSV.
@@ -131,15 +159,8 @@ class EnrollmentService:
             Dictionary with enrollment details or None if not found
         """
         try:
-            if not self.csv_file_path.exists():
-                return None
-            
-            with open(self.csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row.get("enrollment_id") == enrollment_id:
-                        return row
-            return None
+            # Indexed lookup; buffered rows are flushed first so they are visible
+            return self._writer.get(enrollment_id)
         except Exception as e:
-            LOGGER.error(f"Error retrieving enrollment {enrollment_id}: {str(e)}")
+            LOGGER.error("Error retrieving enrollment %s: %s", enrollment_id, e)
             return None
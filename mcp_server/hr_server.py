@@ -10,8 +10,6 @@ demonstrates:
 ---
 """
 from mcp.server.fastmcp import FastMCP
-import asyncio
-import concurrent.futures
 
 mcp = FastMCP("HR MCP", host="0.0.0.0", port=8004)
 
@@ -22,23 +20,8 @@ from mcp_server.hr_service import HRService
 hr_service = HRService()
 
 
-def run_async(coroutine):
-    """
-    Helper function to run a coroutine either in the current loop or a new one
-    """
-    try:
-        loop = asyncio.get_event_loop()
-        if loop.is_running():
-            with concurrent.futures.ThreadPoolExecutor() as executor:
-                future = executor.submit(asyncio.run, coroutine)
-                return future.result()
-        else:
-            return loop.run_until_complete(coroutine)
-    except RuntimeError:
-        return asyncio.run(coroutine)
-
 @mcp.tool()
-def save_hr_request_record(employee_name: str,
+async def save_hr_request_record(employee_name: str,
         request_type: str,
         request_date: str,
         employee_id: str = "",
@@ -77,18 +60,18 @@ def save_hr_request_record(employee_name: str,
             "priority": priority
         }
         
+        # The save only buffers the row; the CSV commit thread does the disk I/O
         result = hr_service.save_hr_request(request_details)
         
         if result["success"]:
-            LOGGER.info(f"HR request submitted successfully: {result['request_id']}")
+            LOGGER.info("HR request submitted successfully: %s", result['request_id'])
             return f"Your HR request has been successfully submitted! Your request ID is {result['request_id']}. Our HR team will review it and get back to you soon."
         else:
-            LOGGER.error(f"HR request submission failed: {result.get('error')}")
+            LOGGER.error("HR request submission failed: %s", result.get('error'))
             return "I apologize, but there was an issue processing your HR request. Please try again or contact the HR department directly."
             
     except Exception as e:
-        error_msg = f"Exception during HR request submission: {str(e)}"
-        LOGGER.error(error_msg)
+        LOGGER.error("Exception during HR request submission: %s", e)
         return "I apologize, but there was an error processing your HR request. Please try again."
 
 
@@ -1,14 +1,19 @@
 """Service for handling HR requests and saving to CSV."""
 import csv
+import itertools
 import os
-from datetime import datetime
+import time
 from pathlib import Path
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, Tuple
 from utils.logger import LOGGER
+from mcp_server.csv_writer import BufferedCSVWriter
 
 
 class HRService:
     """Service to handle HR operations and CSV storage."""
+
+    # Fields an HR request cannot be saved without
+    _REQUIRED: tuple[str, ...] = ("employee_name", "request_type", "request_date")
     
     def __init__(self, csv_file_path: str = "hr_requests.csv"):
         """
@@ -32,7 +37,29 @@ class HRService:
             "request_timestamp",
             "status"
         ]
+        # Default value for every column; copied and filled in per request
+        self._template = dict.fromkeys(self.fieldnames, "")
+        self._template["priority"] = "Normal"
         self._ensure_csv_exists()
+        # Rows are buffered and appended in batches
+        self._writer = BufferedCSVWriter(self.csv_file_path, self.fieldnames)
+        # ID and timestamp prefixes are re-rendered at most once per second;
+        # the counter keeps IDs unique within that second
+        self._stamps = (0, "", "")
+        self._id_counter = itertools.count()
+    
+    def _next_id(self, now: float) -> Tuple[str, str]:
+        """Generate a unique HR request ID and an ISO timestamp for ``now``."""
+        second = int(now)
+        if second != self._stamps[0]:
+            local = time.localtime(second)
+            self._stamps = (
+                second,
+                time.strftime('%Y%m%d%H%M%S', local),
+                time.strftime('%Y-%m-%dT%H:%M:%S', local),
+            )
+        _, compact, iso = self._stamps
+        return f"HR{compact}{next(self._id_counter):04d}", f"{iso}.{int((now - second) * 1_000_000):06d}"
     
     def _ensure_csv_exists(self):
         """Ensure the CSV file exists with headers if it doesn't."""
@@ -40,7 +67,7 @@ class HRService:
             with open(self.csv_file_path, 'w', newline='', encoding='utf-8') as file:
                 writer = csv.DictWriter(file, fieldnames=self.fieldnames)
                 writer.writeheader()
-            LOGGER.info(f"Created HR requests CSV file at {self.csv_file_path}")
+            LOGGER.info("Created HR requests CSV file at %s", self.csv_file_path)
     
     def save_hr_request(self, request_details: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -62,28 +89,8 @@ class HRService:
             Dictionary with request_id and status
         """
         try:
-            # Generate request ID
-            request_id = f"HR{datetime.now().strftime('%Y%m%d%H%M%S')}"
-            
-            # Prepare request record
-            request_record = {
-                "request_id": request_id,
-                "employee_name": request_details.get("employee_name", ""),
-                "employee_id": request_details.get("employee_id", ""),
-                "request_type": request_details.get("request_type", ""),
-                "request_date": request_details.get("request_date", ""),
-                "department": request_details.get("department", ""),
-                "contact_phone": request_details.get("contact_phone", ""),
-                "contact_email": request_details.get("contact_email", ""),
-                "request_description": request_details.get("request_description", ""),
-                "priority": request_details.get("priority", "Normal"),
-                "request_timestamp": datetime.now().isoformat(),
-                "status": "Submitted"
-            }
-            
             # Validate required fields
-            required_fields = ["employee_name", "request_type", "request_date"]
-            missing_fields = [field for field in required_fields if not request_record.get(field)]
+            missing_fields = [field for field in self._REQUIRED if not request_details.get(field)]
             
             if missing_fields:
                 error_msg = f"Missing required fields: {', '.join(missing_fields)}"
@@ -94,12 +101,24 @@ class HRService:
                     "request_id": None
                 }
             
-            # Append to CSV
-            with open(self.csv_file_path, 'a', newline='', encoding='utf-8') as file:
-                writer = csv.DictWriter(file, fieldnames=self.fieldnames)
-                writer.writerow(request_record)
+            # Generate request ID and timestamp from a single clock read
+            request_id, timestamp = self._next_id(time.time())
             
-            LOGGER.info(f"HR request saved successfully: {request_id} for {request_record['employee_name']}")
+            # Prepare request record from the defaults template
+            request_record = self._template.copy()
+            # Only schema columns are copied; any other keys are ignored
+            for field in self.fieldnames:
+                if field in request_details:
+                    request_record[field] = request_details[field]
+            request_record["priority"] = request_record["priority"] or "Normal"
+            request_record["request_id"] = request_id
+            request_record["request_timestamp"] = timestamp
+            request_record["status"] = "Submitted"
+            
+            # Queue for the next batched append to CSV
+            self._writer.append(request_record)
+            
+            LOGGER.info("HR request saved successfully: %s for %s", request_id, request_record['employee_name'])
             
             return {
                 "success": True,
@@ -117,6 +136,14 @@ class HRService:
                 "request_id": None
             }
     
+    def flush(self) -> None:
+        """Write any buffered HR requests to the CSV file."""
+        self._writer.flush()
+
+    def commit(self) -> None:
+        """Write any buffered HR requests to the CSV file and fsync it."""
+        self._writer.commit()
+    
     def get_hr_request(self, request_id: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve an HR request by ID from CSV.
@@ -128,15 +155,8 @@ class HRService:
             Dictionary with request details or None if not found
         """
         try:
-            if not self.csv_file_path.exists():
-                return None
-            
-            with open(self.csv_file_path, 'r', encoding='utf-8') as file:
-                reader = csv.DictReader(file)
-                for row in reader:
-                    if row.get("request_id") == request_id:
-                        return row
-            return None
+            # Indexed lookup; buffered rows are flushed first so they are visible
+            return self._writer.get(request_id)
         except Exception as e:
-            LOGGER.error(f"Error retrieving HR request {request_id}: {str(e)}")
+            LOGGER.error("Error retrieving HR request %s: %s", request_id, e)
             return None
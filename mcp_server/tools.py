@@ -28,21 +28,13 @@ def book_room(guest_name: str, check_in_date: str, check_out_date: str,
         Dictionary with booking confirmation details
     """
     try:
-        booking_details = {
-            "guest_name": guest_name,
-            "check_in_date": check_in_date,
-            "check_out_date": check_out_date,
-            "number_of_guests": number_of_guests,
-            "room_type": room_type,
-            "contact_phone": contact_phone,
-            "contact_email": contact_email,
-            "special_requests": special_requests
-        }
-        
-        result = booking_service.save_booking(booking_details)
+        result = booking_service.save_booking_positional(
+            guest_name, check_in_date, check_out_date, number_of_guests,
+            room_type, contact_phone, contact_email, special_requests
+        )
         
         if result["success"]:
-            LOGGER.info(f"Room booking successful: {result['booking_id']}")
+            LOGGER.info("Room booking successful: %s", result['booking_id'])
             return {
                 "success": True,
                 "booking_id": result["booking_id"],
@@ -53,7 +45,7 @@ def book_room(guest_name: str, check_in_date: str, check_out_date: str,
                 "room_type": room_type
             }
         else:
-            LOGGER.error(f"Room booking failed: {result.get('error')}")
+            LOGGER.error("Room booking failed: %s", result.get('error'))
             return {
                 "success": False,
                 "error": result.get("error", "Unknown error occurred"),
@@ -1,82 +1,236 @@
 """Generic agent implementation that works with any use case."""
 import asyncio
-from typing import List, Optional
+import hashlib
+import re
+from functools import lru_cache
+from typing import Any, List, Optional, Set, Tuple
 
 from livekit.agents import (
     Agent,
     AgentSession,
     JobContext,
     AgentFalseInterruptionEvent,
+    MetricsCollectedEvent,
     NOT_GIVEN,
-    RoomInputOptions,
-    mcp
+    StopResponse,
+    llm,
+    mcp,
+    metrics
 )
-from livekit.plugins import (
-    openai,
-    deepgram,
-    cartesia,
-    noise_cancellation
-)
-from livekit.plugins.turn_detector.multilingual import MultilingualModel
+# Only the plugins in use are imported; each one loads its provider SDK.
+# Import deepgram, cartesia or noise_cancellation here when enabling them below
+from livekit.plugins import openai
 
-from config import ApplicationSettings
+from config import ApplicationSettings, UseCaseConfig
 from modules.prompt_loader import PromptLoader
+from modules.semantic_cache import SemanticCache
 from utils.logger import LOGGER
 
 
+@lru_cache(maxsize=4)
+def _semantic_cache(api_key: str, db_path: str, threshold: float) -> SemanticCache:
+    return SemanticCache(api_key=api_key, db_path=db_path, threshold=threshold)
+
+
+_WORD_RE = re.compile(r"[\w'-]+")
+
+
+def _caller_slots(text: str) -> Set[str]:
+    """
+    Values in a caller utterance that a reply may echo back to them.
+
+    Capitalized words after the first (names, places) and anything with a
+    digit (dates, times, phone and booking numbers), casefolded.
+    """
+    words = _WORD_RE.findall(text)
+    return {
+        word.casefold()
+        for index, word in enumerate(words)
+        if any(char.isdigit() for char in word) or (
+            index and word[0].isupper() and word.split("'")[0] != "I"
+        )
+    }
+
+
+async def _connect_mcp_servers(servers: Tuple[mcp.MCPServerHTTP, ...]) -> None:
+    """Open the SSE connection of every MCP client not yet connected."""
+    pending = [server for server in servers if not server.initialized]
+    results = await asyncio.gather(
+        *(server.initialize() for server in pending), return_exceptions=True
+    )
+    for server, result in zip(pending, results):
+        if isinstance(result, Exception):
+            # The session retries the connection when it lists the tools
+            LOGGER.warning("Failed to preconnect MCP server %s: %s", server, result)
+
+
+def _build_session(cfg: ApplicationSettings, ctx: JobContext) -> AgentSession:
+    """Create the voice pipeline session with its own provider clients."""
+    # The models are loaded once per process by entrypoint.prewarm; fail
+    # fast rather than let a session load (or run without) its own copy
+    missing = [key for key in ("vad", "turn_detector") if key not in ctx.proc.userdata]
+    if missing:
+        raise RuntimeError(
+            f"Models not preloaded in process userdata: {', '.join(missing)}. "
+            "Run the worker with prewarm_fnc=entrypoint.prewarm"
+        )
+    # The LLM, STT and TTS clients are built per session: their HTTP pools
+    # are bound to the job's event loop, and jobs may run on separate loops
+    return AgentSession(
+        llm=openai.LLM(api_key=cfg.llm.API_KEY, **cfg.llm_kwargs),
+        stt=openai.STT(api_key=cfg.llm.API_KEY),
+        tts=openai.TTS(api_key=cfg.llm.API_KEY),
+
+        # stt=deepgram.STT(api_key=cfg.stt.API_KEY,
+        #                  **cfg.stt.model_dump()),
+        # tts=cartesia.TTS(api_key=cfg.tts.API_KEY,
+        #                  **cfg.tts.model_dump()),
+        turn_detection=ctx.proc.userdata["turn_detector"],
+        vad=ctx.proc.userdata["vad"],
+        preemptive_generation=True
+    )
+
+
 class GenericAgent(Agent):
     """Generic agent that can be configured for any use case."""
     
-    def __init__(self, instructions: str, mcp_server_urls: Optional[List[str]] = None) -> None:
+    def __init__(
+        self,
+        instructions: str,
+        mcp_server_urls: Optional[List[str]] = None,
+        response_cache: Optional[SemanticCache] = None,
+        cache_min_words: int = 4,
+        cache_scope: str = "",
+    ) -> None:
         """
         Initialize a generic agent.
         
         Args:
             instructions: The system instructions/prompt for the agent
             mcp_server_urls: Optional list of MCP server URLs to connect to
+            response_cache: Optional cache of replies to earlier questions
+            cache_min_words: Shortest utterance looked up in or added to the cache
+            cache_scope: Use case and prompt version the cached replies belong to
         """
-        mcp_servers = []
-        if mcp_server_urls:
-            for url in mcp_server_urls:
-                mcp_servers.append(mcp.MCPServerHTTP(url=url))
+        self.response_cache = response_cache
+        self.cache_min_words = cache_min_words
+        self.cache_scope = cache_scope
+        # Question awaiting the LLM's reply, as (cache key, embedding)
+        self.pending_question: Optional[Tuple[str, Any]] = None
+        # Names, numbers and other values the caller said this session
+        self.caller_slots: Set[str] = set()
+
+        # One set of MCP clients per agent: their sessions and streams are
+        # bound to the event loop of the job that connects them
+        self.mcp_clients: Tuple[mcp.MCPServerHTTP, ...] = tuple(
+            mcp.MCPServerHTTP(url=url) for url in mcp_server_urls or ()
+        )
         
         super().__init__(
             instructions=instructions,
-            mcp_servers=mcp_servers if mcp_servers else None
+            mcp_servers=list(self.mcp_clients) if self.mcp_clients else None
         )
 
+    async def on_user_turn_completed(
+        self, turn_ctx: llm.ChatContext, new_message: llm.ChatMessage
+    ) -> None:
+        """Answer from the response cache when an equivalent question was seen before."""
+        self.pending_question = None
+        text = new_message.text_content
+        if self.response_cache is None or not text:
+            return
+        self.caller_slots.update(_caller_slots(text))
+        if len(text.split()) < self.cache_min_words:
+            return
+
+        # The agent's previous reply is part of the key, so answers like
+        # "yes, go ahead" only match after the same question from the agent
+        previous = next(
+            (
+                item.text_content
+                for item in reversed(turn_ctx.items)
+                if item.type == "message" and item.role == "assistant"
+            ),
+            None,
+        )
+        key = f"{previous}\n{text}" if previous else text
+
+        try:
+            vector = await self.response_cache.embed(key)
+        except Exception as e:
+            LOGGER.warning("Semantic cache lookup failed: %s", e)
+            return
+
+        # The scan is pure Python; keep it off the event loop
+        response = await asyncio.to_thread(self.response_cache.lookup, vector, self.cache_scope)
+        if response is None:
+            self.pending_question = (key, vector)
+            return
+
+        LOGGER.info("Semantic cache hit for: %s", text)
+        self.session.say(response)
+        # Skip the LLM reply for this turn
+        raise StopResponse()
+
+    def is_cacheable(self, response: str) -> bool:
+        """Whether ``response`` is free of values the caller supplied."""
+        words = {word.casefold() for word in _WORD_RE.findall(response)}
+        return words.isdisjoint(self.caller_slots)
+
 
 class GenericAssistant:
     """Generic assistant that works with any use case configuration."""
     
-    def __init__(self, cfg: ApplicationSettings, ctx: JobContext) -> None:
+    def __init__(self, cfg: ApplicationSettings, ctx: JobContext, prompt: Optional[str] = None) -> None:
         """
         Initialize a generic assistant for any use case.
         
         Args:
             cfg: Application settings including use case configuration
             ctx: Job context from LiveKit
+            prompt: Prompt text already loaded by ``create``; read from the
+                use case's prompt file when omitted
         """
         self.cfg = cfg
         self.ctx = ctx
         self.use_case_config = cfg.current_use_case
         
         # Load prompt dynamically based on use case
-        try:
-            prompt = PromptLoader.load_prompt(self.use_case_config.prompt_file)
-            LOGGER.info(f"Loaded prompt from {self.use_case_config.prompt_file}")
-        except Exception as e:
-            LOGGER.error(f"Failed to load prompt, using fallback: {e}")
-            # Fallback to a basic prompt if file loading fails
-            prompt = f"You are a helpful assistant for {self.use_case_config.name}. {self.use_case_config.greeting}"
+        if prompt is None:
+            try:
+                prompt = self.use_case_config.prompt_text
+                LOGGER.info("Loaded prompt from %s", self.use_case_config.prompt_file)
+            except Exception as e:
+                LOGGER.error("Failed to load prompt, using fallback: %s", e)
+                prompt = self._fallback_prompt(self.use_case_config)
         
         # Get MCP server URLs from configuration
         mcp_urls = [server.url for server in self.use_case_config.mcp_servers]
         if mcp_urls:
-            LOGGER.info(f"Connecting to {len(mcp_urls)} MCP server(s): {mcp_urls}")
+            LOGGER.info("Connecting to %s MCP server(s): %s", len(mcp_urls), mcp_urls)
+        
+        # Shared by every session in the process, like the plugin instances.
+        # Replies are scoped to the use case and prompt they were given under
+        response_cache = None
+        cache_scope = (
+            f"{cfg.use_case_settings.use_case}:"
+            f"{hashlib.sha256(prompt.encode()).hexdigest()[:16]}"
+        )
+        if cfg.semantic_cache.enabled:
+            response_cache = _semantic_cache(
+                cfg.llm.API_KEY, cfg.semantic_cache.db_path, cfg.semantic_cache.threshold
+            )
         
         # Create generic agent with loaded prompt and MCP servers
-        self.agent = GenericAgent(instructions=prompt, mcp_server_urls=mcp_urls)
+        self.agent = GenericAgent(
+            instructions=prompt,
+            mcp_server_urls=mcp_urls,
+            response_cache=response_cache,
+            cache_min_words=cfg.semantic_cache.min_words,
+            cache_scope=cache_scope,
+        )
+        # Background cache writes; referenced until done so they aren't collected
+        self._cache_tasks: Set[asyncio.Task] = set()
         
         # Add context to logs
         self.ctx.log_context_fields = {
@@ -86,33 +240,36 @@ class GenericAssistant:
         }
 
         # Initialize session with LLM, STT, TTS
-        self.session = AgentSession(
-            llm=openai.LLM(api_key=self.cfg.llm.API_KEY,
-                           **self.cfg.llm.model_dump()),
-            stt=openai.STT(api_key=self.cfg.llm.API_KEY,
-                            #  **self.cfg.stt.model_dump()
-                             ),
-            tts=openai.TTS(api_key=self.cfg.llm.API_KEY,
-                            #  **self.cfg.stt.model_dump()\
-                                ),
-
-            # stt=deepgram.STT(api_key=self.cfg.stt.API_KEY,
-            #                  **self.cfg.stt.model_dump()),
-            # tts=cartesia.TTS(api_key=self.cfg.tts.API_KEY,
-            #                  **self.cfg.tts.model_dump()),
-            turn_detection=MultilingualModel(),
-            vad=ctx.proc.userdata["vad"],
-            preemptive_generation=True
-        )
+        self.session = _build_session(cfg, ctx)
 
         # Add error handler for TTS errors
         @self.session.on("error")
         def _on_error(ev):
             if "no audio frames were pushed" in str(ev.error):
-                LOGGER.warning(f"TTS error detected (likely first message): {ev.error}")
+                LOGGER.warning("TTS error detected (likely first message): %s", ev.error)
                 # The session will retry automatically, so we just log it
             else:
-                LOGGER.error(f"Session error: {ev.error}")
+                LOGGER.error("Session error: %s", ev.error)
+        
+        # Report how much of each LLM prompt was served from the provider cache
+        @self.session.on("metrics_collected")
+        def _on_metrics_collected(ev: MetricsCollectedEvent):
+            if isinstance(ev.metrics, metrics.LLMMetrics):
+                LOGGER.debug(
+                    "LLM prompt tokens: %s, cached: %s",
+                    ev.metrics.prompt_tokens, ev.metrics.prompt_cached_tokens
+                )
+        
+        # Cache the LLM's reply to a new question once it has been spoken in full
+        @self.session.on("speech_created")
+        def _on_speech_created(ev):
+            pending = self.agent.pending_question
+            if pending is None or ev.source != "generate_reply":
+                return
+            self.agent.pending_question = None
+            ev.speech_handle.add_done_callback(
+                lambda handle: self._cache_reply(handle, pending)
+            )
         
         # Handle false positive interruptions
         @self.session.on("agent_false_interruption")
@@ -120,35 +277,105 @@ class GenericAssistant:
             LOGGER.warning("False positive interruption, Resuming...")
             self.session.generate_reply(instructions=ev.extra_instructions or NOT_GIVEN)
 
+    def _cache_reply(self, handle: Any, pending: Tuple[str, Any]) -> None:
+        """Store a finished reply, unless it is specific to this caller."""
+        if handle.interrupted or self.agent.response_cache is None:
+            return
+        # Turns that called a tool (bookings, appointments, ...) act for this
+        # caller; replaying their text would skip the tool call
+        if any(item.type != "message" for item in handle.chat_items):
+            return
+        response = " ".join(
+            item.text_content
+            for item in handle.chat_items
+            if item.role == "assistant" and item.text_content
+        )
+        if not response:
+            return
+        if not self.agent.is_cacheable(response):
+            LOGGER.debug("Not caching a reply with caller-supplied values")
+            return
+        task = asyncio.create_task(
+            self.agent.response_cache.store(self.agent.cache_scope, *pending, response)
+        )
+        self._cache_tasks.add(task)
+        task.add_done_callback(self._on_cache_task_done)
+
+    def _on_cache_task_done(self, task: asyncio.Task) -> None:
+        self._cache_tasks.discard(task)
+        if not task.cancelled() and task.exception() is not None:
+            LOGGER.error("Failed to store semantic cache entry: %s", task.exception())
+
+    @classmethod
+    async def create(cls, cfg: ApplicationSettings, ctx: JobContext) -> "GenericAssistant":
+        """Create an assistant, loading the prompt off the event loop."""
+        use_case_config = cfg.current_use_case
+        try:
+            prompt = await PromptLoader.load_prompt_async(use_case_config.prompt_file)
+            LOGGER.info("Loaded prompt from %s", use_case_config.prompt_file)
+        except Exception as e:
+            LOGGER.error("Failed to load prompt, using fallback: %s", e)
+            prompt = cls._fallback_prompt(use_case_config)
+        return cls(cfg, ctx, prompt=prompt)
+
+    @staticmethod
+    def _fallback_prompt(use_case_config: UseCaseConfig) -> str:
+        """Basic prompt used when the prompt file cannot be loaded."""
+        return f"You are a helpful assistant for {use_case_config.name}. {use_case_config.greeting}"
+
+    async def _warm_up_tts(self, timeout: float = 1.0) -> None:
+        """Synthesize a throwaway utterance and wait for its first audio frame."""
+        tts = self.session.tts
+        if tts is None:
+            return
+
+        async def _first_frame() -> None:
+            async with tts.synthesize(".") as stream:
+                async for _ in stream:
+                    break
+
+        try:
+            await asyncio.wait_for(_first_frame(), timeout)
+            LOGGER.info("TTS warmup completed")
+        except Exception as e:
+            LOGGER.warning("TTS warmup did not complete: %r", e)
+
+    async def _start_session(self) -> None:
+        """Connect the MCP clients, then start the voice pipeline session."""
+        # The SSE handshakes run together, while the room connection and TTS
+        # warmup are in flight; the session skips clients already connected
+        await _connect_mcp_servers(self.agent.mcp_clients)
+        await self.session.start(
+            agent=self.agent,
+            room=self.ctx.room,
+            # room_input_options=RoomInputOptions(
+            #     # LiveKit Cloud enhanced noise cancellation
+            #     # - If self-hosting, omit this parameter
+            #     # - For telephony applications, use `BVCTelephony` for best results
+            #     # noise_cancellation=noise_cancellation.BVC(),
+            # ),
+        )
+
     async def start(self):
         """Start the agent session and connect to the room."""
+        # Prime the TTS connection so the first message is not dropped. It runs
+        # alongside the session start and finishes as soon as audio arrives
+        tts_ready = asyncio.create_task(self._warm_up_tts())
         try:
             use_case_name = self.use_case_config.name
-            LOGGER.info(f"Starting {use_case_name} for room: {self.ctx.room.name}")
+            LOGGER.info("Starting %s for room: %s", use_case_name, self.ctx.room.name)
             
-            # Start the session, which initializes the voice pipeline and warms up the models
-            await self.session.start(
-                agent=self.agent,
-                room=self.ctx.room,
-                # room_input_options=RoomInputOptions(
-                #     # LiveKit Cloud enhanced noise cancellation
-                #     # - If self-hosting, omit this parameter
-                #     # - For telephony applications, use `BVCTelephony` for best results
-                #     # noise_cancellation=noise_cancellation.BVC(),
-                # ),
+            # Start the session (voice pipeline and models) and join the room at
+            # the same time; both are independent network round trips
+            await asyncio.gather(
+                self._start_session(),
+                self.ctx.connect(),
+                tts_ready,
             )
-            LOGGER.info(f"{use_case_name} session started successfully")
-
-            # Small delay to allow TTS service to fully initialize
-            # This prevents the first message TTS error
-            await asyncio.sleep(1.0)  # 1 second delay to warm up TTS
-            LOGGER.info("TTS warmup delay completed")
-
-            # Join the room and connect to the user
-            await self.ctx.connect()
-            LOGGER.info("Connected to room successfully")
+            LOGGER.info("%s session started and connected to room", use_case_name)
         except Exception as e:
-            LOGGER.error(f"Failed to start {self.use_case_config.name}: {e}")
+            tts_ready.cancel()
+            LOGGER.error("Failed to start %s: %s", self.use_case_config.name, e)
             raise
 
 
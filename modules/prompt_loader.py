@@ -1,9 +1,20 @@
 """Dynamic prompt loader for use case-specific prompts."""
+import asyncio
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 from utils import load_yaml
 from utils.logger import LOGGER
 
+# Prompts compiled in by bake_prompts.py at deploy time, keyed by prompt_file
+try:
+    from modules._baked_prompts import PROMPTS as _BAKED_PROMPTS
+except ImportError:
+    _BAKED_PROMPTS = {}
+
+# Directories a relative prompt path is looked up in, in order
+_SEARCH_PATHS = (Path("."), Path("config"))
+
 
 class PromptLoader:
     """Load prompts dynamically based on use case configuration."""
@@ -23,42 +34,61 @@ class PromptLoader:
             FileNotFoundError: If the prompt file doesn't exist
             ValueError: If the prompt file doesn't contain a 'prompt' key
         """
+        baked = _BAKED_PROMPTS.get(prompt_file)
+        if baked is not None:
+            return baked
+        
         try:
-            prompt_path = Path(prompt_file)
-            
-            # Try relative path first
-            if not prompt_path.exists():
-                # Try relative to project root
-                prompt_path = Path(".") / prompt_file
-                if not prompt_path.exists():
-                    # Try relative to config directory
-                    prompt_path = Path("config") / prompt_file
-                    if not prompt_path.exists():
-                        raise FileNotFoundError(
-                            f"Prompt file not found: {prompt_file}. "
-                            f"Tried: {prompt_file}, ./{prompt_file}, config/{prompt_file}"
-                        )
+            path = Path(prompt_file)
+            candidates = (path,) if path.is_absolute() else tuple(base / path for base in _SEARCH_PATHS)
+            # First candidate that exists; one stat per candidate
+            prompt_path = next((candidate for candidate in candidates if candidate.is_file()), None)
+            if prompt_path is None:
+                raise FileNotFoundError(
+                    f"Prompt file not found: {prompt_file}. "
+                    f"Tried: {', '.join(str(candidate) for candidate in candidates)}"
+                )
             
-            LOGGER.info(f"Loading prompt from: {prompt_path}")
-            prompt_data = load_yaml(str(prompt_path))
-            
-            # Support both 'prompt' key and direct string content
-            if isinstance(prompt_data, str):
-                return prompt_data
-            elif isinstance(prompt_data, dict):
-                prompt = prompt_data.get("prompt", "")
-                if not prompt:
-                    raise ValueError(
-                        f"Prompt file {prompt_file} does not contain a 'prompt' key"
-                    )
-                return prompt
-            else:
-                raise ValueError(f"Invalid prompt file format in {prompt_file}")
+            # Keyed on the absolute path, so every spelling of the same file
+            # shares one entry; mtime and size pick up edits on the next call
+            prompt_path = prompt_path.resolve()
+            stat = prompt_path.stat()
+            return PromptLoader._read_prompt(str(prompt_path), stat.st_mtime_ns, stat.st_size)
                 
         except Exception as e:
-            LOGGER.error(f"Failed to load prompt from {prompt_file}: {e}")
+            LOGGER.error("Failed to load prompt from %s: %s", prompt_file, e)
             raise
     
+    @staticmethod
+    async def load_prompt_async(prompt_file: str) -> str:
+        """
+        Load prompt from YAML file without blocking the event loop.
+        
+        The file checks, read and YAML parse of ``load_prompt`` run in a worker
+        thread; once the prompt is cached only the ``stat`` calls remain.
+        """
+        return await asyncio.to_thread(PromptLoader.load_prompt, prompt_file)
+    
+    @staticmethod
+    @lru_cache(maxsize=32)
+    def _read_prompt(prompt_path: str, mtime_ns: int, size: int) -> str:
+        """Read and validate a prompt file; cached per file version."""
+        LOGGER.info("Loading prompt from: %s", prompt_path)
+        prompt_data = load_yaml(prompt_path)
+        
+        # Support both 'prompt' key and direct string content
+        if isinstance(prompt_data, str):
+            return prompt_data
+        elif isinstance(prompt_data, dict):
+            prompt = prompt_data.get("prompt", "")
+            if not prompt:
+                raise ValueError(
+                    f"Prompt file {prompt_path} does not contain a 'prompt' key"
+                )
+            return prompt
+        else:
+            raise ValueError(f"Invalid prompt file format in {prompt_path}")
+    
     @staticmethod
     def get_greeting(use_case_config: Dict[str, Any]) -> str:
         """
@@ -0,0 +1,155 @@
+"""Semantic response cache for repeated questions."""
+import asyncio
+import math
+import operator
+import sqlite3
+import weakref
+from array import array
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from openai import AsyncOpenAI
+
+from utils.logger import LOGGER
+
+
+class SemanticCache:
+    """
+    Answers questions that are close in meaning to ones already answered.
+
+    Entries pair an utterance embedding with the reply given to it and are
+    stored in SQLite, so they survive restarts. Every entry belongs to a
+    scope (the use case and prompt version it was answered under) and is
+    only served to lookups in the same scope. Lookups compare against an
+    in-memory copy of the embeddings; no request leaves the process except
+    the embedding call, and repeats of the exact same text skip that too.
+    """
+
+    def __init__(
+        self,
+        api_key: str,
+        db_path: str = "semantic_cache.db",
+        model: str = "text-embedding-3-small",
+        dimensions: int = 256,
+        threshold: float = 0.92,
+        max_entries: int = 1000,
+    ) -> None:
+        """
+        Initialize the cache and load stored entries.
+
+        Args:
+            api_key: OpenAI API key used for embeddings
+            db_path: Path to the SQLite database file
+            model: OpenAI embedding model
+            dimensions: Embedding size requested from the model
+            threshold: Minimum cosine similarity for a hit
+            max_entries: Entries kept; the oldest are dropped first
+        """
+        self.model = model
+        self.dimensions = dimensions
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self._api_key = api_key
+        # One client per event loop: its connection pool is bound to the loop
+        # it was first used on, and jobs may run on separate loops
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncOpenAI]" = (
+            weakref.WeakKeyDictionary()
+        )
+        # Exact-text embedding cache, in insertion order for eviction
+        self._embedded: dict[str, array] = {}
+
+        self._db = sqlite3.connect(Path(db_path), check_same_thread=False)
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS responses ("
+            "id INTEGER PRIMARY KEY, model TEXT, utterance TEXT, "
+            "embedding BLOB, response TEXT, scope TEXT)"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(responses)")}
+        if "scope" not in columns:
+            # Rows written before entries were scoped never match a lookup
+            self._db.execute("ALTER TABLE responses ADD COLUMN scope TEXT")
+        # Entries per scope, oldest first
+        self._entries: Dict[str, List[Tuple[array, str]]] = {}
+        rows = self._db.execute(
+            "SELECT scope, embedding, response FROM responses "
+            "WHERE model = ? AND scope IS NOT NULL ORDER BY id",
+            (f"{model}:{dimensions}",),
+        ).fetchall()
+        for scope, blob, response in rows:
+            vector = array("f")
+            vector.frombytes(blob)
+            entries = self._entries.setdefault(scope, [])
+            entries.append((vector, response))
+            if len(entries) > max_entries:
+                del entries[0]
+        LOGGER.info(
+            "Semantic cache loaded %s entries in %s scope(s) from %s",
+            sum(map(len, self._entries.values())), len(self._entries), db_path,
+        )
+
+    @staticmethod
+    def _normalize(text: str) -> str:
+        return " ".join(text.lower().split())
+
+    def _client(self) -> AsyncOpenAI:
+        loop = asyncio.get_running_loop()
+        client = self._clients.get(loop)
+        if client is None:
+            client = self._clients[loop] = AsyncOpenAI(api_key=self._api_key)
+        return client
+
+    async def embed(self, text: str) -> array:
+        """Unit-length embedding of ``text``."""
+        key = self._normalize(text)
+        vector = self._embedded.get(key)
+        if vector is None:
+            result = await self._client().embeddings.create(
+                model=self.model, input=key, dimensions=self.dimensions
+            )
+            values = result.data[0].embedding
+            norm = math.sqrt(sum(v * v for v in values)) or 1.0
+            vector = array("f", (v / norm for v in values))
+            if len(self._embedded) >= self.max_entries:
+                del self._embedded[next(iter(self._embedded))]
+            self._embedded[key] = vector
+        return vector
+
+    def lookup(self, vector: array, scope: str) -> Optional[str]:
+        """
+        Cached reply for the closest stored utterance, if it is close enough.
+
+        Scans every entry in ``scope``; call it from a worker thread.
+        """
+        best_score, best_response = self.threshold, None
+        # Copy, as store() may append on the event loop during the scan
+        for stored, response in tuple(self._entries.get(scope, ())):
+            score = sum(map(operator.mul, vector, stored))
+            if score >= best_score:
+                best_score, best_response = score, response
+        return best_response
+
+    async def store(self, scope: str, utterance: str, vector: array, response: str) -> None:
+        """Remember ``response`` as the reply to ``utterance`` in ``scope``."""
+        entries = self._entries.setdefault(scope, [])
+        entries.append((vector, response))
+        if len(entries) > self.max_entries:
+            del entries[0]
+        try:
+            await asyncio.to_thread(self._insert, scope, utterance, vector, response)
+        except sqlite3.Error as e:
+            LOGGER.error("Failed to persist semantic cache entry: %s", e)
+
+    def _insert(self, scope: str, utterance: str, vector: array, response: str) -> None:
+        model = f"{self.model}:{self.dimensions}"
+        with self._db:
+            self._db.execute(
+                "INSERT INTO responses (model, scope, utterance, embedding, response) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (model, scope, utterance, vector.tobytes(), response),
+            )
+            # Keep each scope the same size as its in-memory entries
+            self._db.execute(
+                "DELETE FROM responses WHERE model = ? AND scope = ? AND id NOT IN ("
+                "SELECT id FROM responses WHERE model = ? AND scope = ? ORDER BY id DESC LIMIT ?)",
+                (model, scope, model, scope, self.max_entries),
+            )
@@ -1,46 +1,38 @@
 """Run MCP server based on configuration."""
+import importlib
 import sys
-from pathlib import Path
-from dotenv import load_dotenv
+from functools import cache
+from utils import load_env
 
 # Load environment variables
-env_file = Path(".env.local")
-if not env_file.exists():
-    env_file = Path(".env.prod")
-if env_file.exists():
-    load_dotenv(env_file)
-else:
-    load_dotenv()
+load_env()
 
 from config import ApplicationSettings
 from utils.logger import LOGGER
 
-# Mapping of server names to module names
-SERVER_MODULE_MAP = {
-    "booking_server": "booking_server",
-    "appointment_server": "appointment_server",
-    "enrollment_server": "enrollment_server",
-    "hr_server": "hr_server",
-}
+# MCP servers that can be started; each name is a module under mcp_server/.
+# Modules are imported on demand: importing one creates its FastMCP instance
+# and opens its CSV file, so only the configured server is loaded
+SERVER_MODULES = (
+    "booking_server",
+    "appointment_server",
+    "enrollment_server",
+    "hr_server",
+    "combined_server",
+)
 
 
+@cache
 def get_mcp_server_module(server_name: str):
     """Dynamically import and return the MCP server module."""
-    if server_name not in SERVER_MODULE_MAP:
+    if server_name not in SERVER_MODULES:
         raise ValueError(
             f"Unknown MCP server: {server_name}. "
-            f"Available servers: {list(SERVER_MODULE_MAP.keys())}"
+            f"Available servers: {list(SERVER_MODULES)}"
         )
     
-    module_name = SERVER_MODULE_MAP[server_name]
-    try:
-        # Dynamically import the module
-        module = __import__(f"mcp_server.{module_name}", fromlist=[module_name])
-        return module
-    except ImportError as e:
-        raise ImportError(
-            f"Failed to import MCP server module '{module_name}': {e}"
-        )
+    # Import errors propagate with their original traceback
+    return importlib.import_module(f"mcp_server.{server_name}")
 
 
 if __name__ == "__main__":
@@ -60,8 +52,8 @@ if __name__ == "__main__":
         server_name = mcp_server_config.name
         
         LOGGER.info(
-            f"Starting MCP server '{server_name}' for use case: "
-            f"{settings.use_case_settings.use_case}"
+            "Starting MCP server '%s' for use case: %s",
+            server_name, settings.use_case_settings.use_case
         )
         print(f"🚀 Starting MCP server: {server_name}")
         print(f"   Use case: {settings.use_case_settings.use_case}")
@@ -72,6 +64,6 @@ if __name__ == "__main__":
         server_module.mcp.run(transport="sse")
         
     except Exception as e:
-        LOGGER.error(f"Failed to start MCP server: {e}")
+        LOGGER.error("Failed to start MCP server: %s", e)
         print(f"❌ Error: {e}")
         sys.exit(1)
\ No newline at end of file
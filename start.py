@@ -5,6 +5,7 @@ import sys
 import time
 import signal
 import os
+import threading
 from pathlib import Path
 
 def check_env_file():
@@ -46,10 +47,10 @@ def main():
     try:
         # Start FastAPI server
         print("📡 Starting FastAPI server...")
+        # Children inherit this terminal's stdout/stderr; unread pipes would
+        # fill up and stall them
         api_process = subprocess.Popen(
-            [sys.executable, "-m", "uvicorn", "api.app:app", "--host", "0.0.0.0", "--port", "8000"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            [sys.executable, "-m", "uvicorn", "api.app:app", "--host", "0.0.0.0", "--port", "8000"]
         )
         processes.append(api_process)
         print(f"   FastAPI server started (PID: {api_process.pid})")
@@ -62,9 +63,7 @@ def main():
         # Start LiveKit agent
         print("🤖 Starting LiveKit agent...")
         agent_process = subprocess.Popen(
-            [sys.executable, "entrypoint.py"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE
+            [sys.executable, "entrypoint.py"]
         )
         processes.append(agent_process)
         print(f"   LiveKit agent started (PID: {agent_process.pid})")
@@ -75,15 +74,22 @@ def main():
         print("Press Ctrl+C to stop all services")
         print("")
         
-        # Wait for processes
-        while True:
-            # Check if processes are still alive
-            for proc in processes:
-                if proc.poll() is not None:
-                    print(f"⚠️  Process {proc.pid} exited unexpectedly")
-                    cleanup_processes(processes)
-                    sys.exit(1)
-            time.sleep(1)
+        # Block until any child exits; one waiter thread per child sets the event
+        exited = threading.Event()
+        
+        def wait_for(proc):
+            proc.wait()
+            exited.set()
+        
+        for proc in processes:
+            threading.Thread(target=wait_for, args=(proc,), daemon=True).start()
+        exited.wait()
+        
+        for proc in processes:
+            if proc.poll() is not None:
+                print(f"⚠️  Process {proc.pid} exited unexpectedly")
+        cleanup_processes(processes)
+        sys.exit(1)
             
     except KeyboardInterrupt:
         cleanup_processes(processes)
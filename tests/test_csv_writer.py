@@ -0,0 +1,119 @@
+"""Tests for the buffered CSV writer shared by the MCP record services."""
+import csv
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from mcp_server import csv_writer
+from mcp_server.csv_writer import BufferedCSVWriter
+
+FIELDNAMES = ["record_id", "name", "notes"]
+
+
+class BufferedCSVWriterTest(unittest.TestCase):
+    def setUp(self):
+        # Rows are flushed explicitly; the shared commit thread would race the asserts
+        patcher = mock.patch.object(csv_writer._COMMITTER, "schedule")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "records.csv"
+        with open(self.path, "w", newline="", encoding="utf-8") as file:
+            csv.writer(file).writerow(FIELDNAMES)
+
+    def _writer(self) -> BufferedCSVWriter:
+        writer = BufferedCSVWriter(self.path, FIELDNAMES)
+        self.addCleanup(writer.close)
+        return writer
+
+    def _rows(self):
+        with open(self.path, newline="", encoding="utf-8") as file:
+            return list(csv.DictReader(file))
+
+    def test_round_trip_quotes_newlines_and_none(self):
+        writer = self._writer()
+        records = [
+            {"record_id": "R1", "name": 'Say "hi", please', "notes": "line one\nline two"},
+            {"record_id": "R2", "name": "Plain", "notes": None},
+            {"record_id": "R3", "name": "Comma, here", "notes": "\r\n"},
+        ]
+        for record in records:
+            writer.append(record)
+        writer.flush()
+
+        expected = [
+            {key: "" if value is None else value for key, value in record.items()}
+            for record in records
+        ]
+        self.assertEqual(self._rows(), expected)
+        for record in expected:
+            self.assertEqual(writer.get(record["record_id"]), record)
+
+    def test_get_after_reopening(self):
+        writer = self._writer()
+        writer.append({"record_id": "R1", "name": "First", "notes": "a\nb"})
+        writer.append({"record_id": "R2", "name": "Second", "notes": ""})
+        writer.close()
+
+        reopened = self._writer()
+        self.assertEqual(reopened.get("R2"), {"record_id": "R2", "name": "Second", "notes": ""})
+        self.assertEqual(reopened.get("R1"), {"record_id": "R1", "name": "First", "notes": "a\nb"})
+        self.assertIsNone(reopened.get("missing"))
+
+    def test_get_finds_rows_from_another_writer(self):
+        writer = self._writer()
+        other = self._writer()
+        writer.append({"record_id": "R1", "name": "Mine", "notes": ""})
+        writer.flush()
+        other.append({"record_id": "R2", "name": "Theirs", "notes": ""})
+        other.flush()
+        writer.append({"record_id": "R3", "name": "Mine again", "notes": ""})
+        writer.flush()
+
+        self.assertEqual(writer.get("R3")["name"], "Mine again")
+        self.assertEqual(writer.get("R2")["name"], "Theirs")
+        self.assertEqual(other.get("R1")["name"], "Mine")
+
+    def test_partial_write_is_completed_without_duplicates(self):
+        writer = self._writer()
+        writer.append({"record_id": "R1", "name": "First", "notes": ""})
+        writer.append({"record_id": "R2", "name": "Second", "notes": ""})
+        real_write = os.write
+        calls = []
+
+        def short_then_fail(fd, data):
+            calls.append(len(data))
+            if len(calls) == 1:
+                # Ends partway through the first row
+                return real_write(fd, bytes(data[:5]))
+            raise OSError("disk full")
+
+        with mock.patch.object(csv_writer.os, "write", short_then_fail):
+            with self.assertRaises(OSError):
+                writer.flush()
+        writer.flush()
+
+        self.assertEqual([row["record_id"] for row in self._rows()], ["R1", "R2"])
+        self.assertEqual(writer.get("R1")["name"], "First")
+        self.assertEqual(writer.get("R2")["name"], "Second")
+
+    def test_failed_write_keeps_rows_pending(self):
+        writer = self._writer()
+        writer.append({"record_id": "R1", "name": "First", "notes": ""})
+
+        with mock.patch.object(csv_writer.os, "write", side_effect=OSError("disk full")):
+            with self.assertRaises(OSError):
+                writer.flush()
+        self.assertEqual(self._rows(), [])
+
+        writer.flush()
+        writer.flush()
+        self.assertEqual(self._rows(), [{"record_id": "R1", "name": "First", "notes": ""}])
+
+
+if __name__ == "__main__":
+    unittest.main()
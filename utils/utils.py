@@ -1,13 +1,135 @@
-from typing import Any
+import hashlib
+import os
+import stat
+import tempfile
 from pathlib import Path
+from typing import Any
+import orjson
 import yaml
+from dotenv import load_dotenv
+
+# libyaml-backed loader when PyYAML was built with it; same semantics as safe_load
+try:
+    from yaml import CSafeLoader as _YAMLLoader
+except ImportError:
+    from yaml import SafeLoader as _YAMLLoader
+
+# path -> (mtime, size, parsed data); re-parsed only when the file changes on disk
+_YAML_CACHE: dict[str, tuple[float, int, dict[str, Any]]] = {}
 
 def load_yaml(path: str) -> dict[str, Any]:
-    file_path = Path(path)
-    if not file_path.is_file():
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
         raise FileNotFoundError(f"The YAML file at {path} was not found.")
 
-    with open(file_path, "r") as file:
-        data = yaml.safe_load(file)
-        
-    return data or {}
\ No newline at end of file
+    cached = _YAML_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        return cached[2]
+
+    data = _load_yaml_sidecar(path, st)
+    if data is None:
+        with open(path, "rb") as file:
+            data = yaml.load(file, Loader=_YAMLLoader)
+        data = data or {}
+        _write_yaml_sidecar(path, st, data)
+
+    _YAML_CACHE[path] = (st.st_mtime, st.st_size, data)
+    return data
+
+
+# Parsed YAML is also kept on disk as JSON in a per-user cache directory, so
+# fresh processes (API workers, agent job processes) skip YAML parsing at
+# start-up. The config directories themselves may be read-only
+_SIDECAR_DIR = os.path.join(
+    os.getenv("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"),
+    "generic-agent-yaml",
+)
+
+_NOFOLLOW = getattr(os, "O_NOFOLLOW", 0)
+
+
+def _sidecar_path(path: str) -> str:
+    digest = hashlib.sha256(os.path.abspath(path).encode()).hexdigest()[:32]
+    return os.path.join(_SIDECAR_DIR, digest + ".json")
+
+
+def _owned_privately(st: os.stat_result) -> bool:
+    """Whether ``st`` belongs to this user and no one else can write to it."""
+    if not hasattr(os, "getuid"):
+        return True
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _sidecar_dir_ok() -> bool:
+    # Anyone who can write to the directory could plant a sidecar, so it
+    # must be a real directory owned by this user and closed to others
+    try:
+        st = os.lstat(_SIDECAR_DIR)
+    except OSError:
+        return False
+    return stat.S_ISDIR(st.st_mode) and _owned_privately(st) and not st.st_mode & 0o077
+
+
+def _load_yaml_sidecar(path: str, st: os.stat_result) -> Any:
+    if not _sidecar_dir_ok():
+        return None
+    try:
+        fd = os.open(_sidecar_path(path), os.O_RDONLY | _NOFOLLOW)
+        with open(fd, "rb") as file:
+            if not _owned_privately(os.fstat(fd)):
+                return None
+            cached = orjson.loads(file.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    # A truncated or hand-edited sidecar falls back to the YAML file
+    if not isinstance(cached, dict):
+        return None
+    if cached.get("mtime_ns") != st.st_mtime_ns or cached.get("size") != st.st_size:
+        return None
+    return cached.get("data")
+
+
+def _write_yaml_sidecar(path: str, st: os.stat_result, data: Any) -> None:
+    try:
+        blob = orjson.dumps({"mtime_ns": st.st_mtime_ns, "size": st.st_size, "data": data})
+    except TypeError:
+        return
+    # Skip data JSON cannot represent faithfully (e.g. YAML dates)
+    if orjson.loads(blob)["data"] != data:
+        return
+    tmp = None
+    try:
+        os.makedirs(os.path.dirname(_SIDECAR_DIR), exist_ok=True)
+        try:
+            os.mkdir(_SIDECAR_DIR, 0o700)
+        except FileExistsError:
+            pass
+        if not _sidecar_dir_ok():
+            # Someone else's (or a world-writable) directory; go without
+            return
+        # Unpredictable name, created with O_EXCL and mode 0600
+        fd, tmp = tempfile.mkstemp(dir=_SIDECAR_DIR, suffix=".tmp")
+        with open(fd, "wb") as file:
+            file.write(blob)
+        os.replace(tmp, _sidecar_path(path))
+    except OSError:
+        # An unwritable cache directory just goes without the sidecar
+        if tmp is not None:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+
+
+def load_env(override: bool = False) -> None:
+    """Load environment variables from .env.local, falling back to .env.prod or .env."""
+    env_file = Path(".env.local")
+    if not env_file.exists():
+        env_file = Path(".env.prod")
+    if env_file.exists():
+        load_dotenv(env_file, override=override)
+    else:
+        load_dotenv(override=override)